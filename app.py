@@ -1,14 +1,97 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import os
-from utils.data_loader import load_sample_data, load_data_from_csv, get_data_metadata, load_filtered_data
-from utils.data_processor import clean_data, calculate_growth_rates, calculate_market_share
-from utils.data_visualizer import plot_global_trends, create_choropleth_map
-from utils.forecasting import forecast_linear, forecast_polynomial, plot_forecast
+from concurrent.futures import ThreadPoolExecutor
+from utils.data_loader import load_sample_data, load_data_from_csv
+from utils.database import init_db
+from utils.data_processor import clean_data, build_aggregates, extract_metadata
+from utils.ui import format_data_summary, render_data_summary
 
-# Import page functions from the consolidated dashboard_pages.py file
-from dashboard_pages import overview_page, regional_analysis_page, market_share_page, forecasting_page
+# Page name -> render function in dashboard_pages.py, in sidebar order
+PAGES = {
+    "Overview": "overview_page",
+    "Regional Analysis": "regional_analysis_page",
+    "Market Share": "market_share_page",
+    "Forecasting": "forecasting_page",
+}
+
+def _get_page(name):
+    """Imports dashboard_pages on first use, so the app shell renders before the
+    plotting and forecasting dependencies are loaded."""
+    import dashboard_pages
+    return getattr(dashboard_pages, PAGES[name])
+
+# Background worker for precomputing page aggregates after a data load; created
+# once per server process, since this script re-executes on every rerun
+@st.cache_resource(show_spinner=False)
+def _get_aggregate_executor():
+    return ThreadPoolExecutor(max_workers=1)
+
+# Tables and indexes only need creating once per server process, not once per session
+@st.cache_resource(show_spinner=False)
+def _init_database():
+    init_db()
+
+# Cached wrappers so widget-driven reruns reuse results instead of recomputing them
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_load_sample_data():
+    return load_sample_data()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_clean(data):
+    return clean_data(data)
+
+@st.fragment
+def _render_filters():
+    """Renders the data filters; changing them reruns only this fragment."""
+    st.header("Filters")
+    
+    # Year range selector
+    if st.session_state.years:
+        min_year = st.session_state.year_min
+        max_year = st.session_state.year_max
+        year_range = st.slider(
+            "Select Year Range",
+            min_value=min_year,
+            max_value=max_year,
+            value=(min_year, max_year)
+        )
+    else:
+        year_range = (2010, 2023)  # Default range if years not available
+    
+    # Region selector
+    if st.session_state.regions:
+        default_regions = st.session_state.regions[:5] if len(st.session_state.regions) > 5 else st.session_state.regions
+        selected_regions = st.multiselect(
+            "Select Regions",
+            options=st.session_state.regions,
+            default=default_regions
+        )
+    else:
+        selected_regions = []  # Default empty selection if regions not available
+    
+    # Pages render from the full cleaned data, so the selection is only
+    # summarised here, counted on the in-memory frame rather than queried
+    # from the database on every filter change
+    data = st.session_state.cleaned_data
+    years = data['year'].to_numpy()
+    in_selection = (years >= year_range[0]) & (years <= year_range[1])
+    if selected_regions:
+        # An empty region selection means all regions
+        in_selection &= data['region'].isin(selected_regions).to_numpy()
+    record_count = int(in_selection.sum())
+    if record_count:
+        st.success(f"✅ {record_count} records match the selected filters")
+    else:
+        st.warning("⚠️ No data found for selected filters.")
+
+@st.fragment
+def _render_page(name):
+    """Renders a dashboard page; widgets on the page rerun only this fragment."""
+    try:
+        _get_page(name)()
+    except Exception as e:
+        st.error(f"Error loading page: {str(e)}")
+        st.code(str(e), language="python")
 
 # Set page configuration
 st.set_page_config(
@@ -24,6 +107,11 @@ if 'data' not in st.session_state:
     st.session_state.cleaned_data = None
     st.session_state.regions = None
     st.session_state.years = None
+    st.session_state.year_min = None
+    st.session_state.year_max = None
+    st.session_state.data_summary = None
+    st.session_state.aggs_future = None
+    st.session_state.uploaded_file_id = None
 
 # Title and introduction
 st.title("Electric Vehicle Adoption Analysis Dashboard")
@@ -47,7 +135,12 @@ data_source = st.sidebar.radio(
 
 if data_source == "Upload your own CSV":
     uploaded_file = st.sidebar.file_uploader("Upload EV data CSV", type=['csv'])
-    if uploaded_file is not None:
+    # The uploader keeps returning the same file on every rerun, so it is only
+    # ingested (parsed, stored and cached) once per upload
+    if uploaded_file is not None and uploaded_file.file_id != st.session_state.uploaded_file_id:
+        # The file preview stays visible; the progress area below it is cleared once loaded
+        preview_area = st.container()
+        
         # Create main area for upload status and animations
         upload_placeholder = st.empty()
         
@@ -58,59 +151,57 @@ if data_source == "Upload your own CSV":
             status_text = st.empty()
             
             try:
-                # Step 1: Save uploaded file temporarily
+                # Step 1: Rewind the uploaded buffer; it is parsed in place, without a copy
                 status_text.info("⏳ Receiving uploaded file...")
-                temp_file_path = f"temp_upload_{uploaded_file.name}"
-                with open(temp_file_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
+                uploaded_file.seek(0)
                 progress_bar.progress(20)
                 
                 # Step 2: Validate CSV format
                 status_text.info("⏳ Validating CSV format...")
-                import pandas as pd
-                file_preview = pd.read_csv(temp_file_path, nrows=5)
+                file_preview = pd.read_csv(uploaded_file, nrows=5)
+                uploaded_file.seek(0)
                 progress_bar.progress(40)
                 
                 # Show preview of the data
-                st.markdown("#### File Preview:")
-                st.dataframe(file_preview, use_container_width=True)
+                preview_area.markdown("#### File Preview:")
+                preview_area.dataframe(file_preview, use_container_width=True)
                 
                 # Step 3: Load into database
                 status_text.info("⏳ Loading data into database...")
-                data = load_data_from_csv(temp_file_path)
+                data = load_data_from_csv(uploaded_file)
                 st.session_state.data = data
                 progress_bar.progress(60)
                 
                 # Step 4: Clean and process data
                 status_text.info("⏳ Processing and organizing data...")
-                st.session_state.cleaned_data = clean_data(data)
+                st.session_state.cleaned_data = _cached_clean(data)
+                st.session_state.aggs_future = _get_aggregate_executor().submit(build_aggregates, st.session_state.cleaned_data)
                 progress_bar.progress(80)
                 
+                # Cached results refer to the previous dataset
+                _cached_load_sample_data.clear()
+                
                 # Step 5: Extract metadata
                 status_text.info("⏳ Finalizing data setup...")
-                st.session_state.regions, st.session_state.years = get_data_metadata()
+                st.session_state.regions, st.session_state.years = extract_metadata(st.session_state.cleaned_data)
+                # Years come back sorted, so the bounds are the first and last entries
+                st.session_state.year_min = st.session_state.years[0]
+                st.session_state.year_max = st.session_state.years[-1]
+                st.session_state.data_summary = format_data_summary(
+                    len(data),
+                    len(st.session_state.regions),
+                    st.session_state.year_min,
+                    st.session_state.year_max
+                )
                 progress_bar.progress(100)
                 
-                # Show success message and data summary
-                status_text.success(f"✅ Data successfully loaded and stored in database!")
-                
-                # Display data summary
-                col1, col2, col3 = st.columns(3)
-                col1.metric("Total Records", f"{len(data):,}")
-                col2.metric("Regions", f"{len(st.session_state.regions)}")
-                col3.metric("Time Period", f"{min(st.session_state.years)} - {max(st.session_state.years)}")
-                
-                # Clean up temporary file
-                if os.path.exists(temp_file_path):
-                    os.remove(temp_file_path)
-                
                 # Show success in sidebar
                 st.sidebar.success("✅ CSV data successfully loaded!")
                 
-                # Wait a moment to show completion
-                import time
-                time.sleep(2)
+                # Confirm with a non-blocking toast and clear the progress area
+                st.toast("✅ Data successfully loaded and stored in database!")
                 upload_placeholder.empty()
+                st.session_state.uploaded_file_id = uploaded_file.file_id
                 
             except Exception as e:
                 # Show error message
@@ -118,18 +209,11 @@ if data_source == "Upload your own CSV":
                 status_text.error(f"❌ Error: {str(e)}")
                 st.sidebar.error(f"Error loading data: {e}")
                 
-                # Clean up if needed
-                if os.path.exists(temp_file_path):
-                    os.remove(temp_file_path)
-                
                 # Reset session state
                 st.session_state.data = None
                 st.session_state.cleaned_data = None
-                
-                # Wait a moment to show the error
-                import time
-                time.sleep(3)
-                upload_placeholder.empty()
+                st.session_state.aggs_future = None
+                st.session_state.uploaded_file_id = None
 else:
     # Load sample data
     if st.session_state.data is None:
@@ -142,47 +226,43 @@ else:
             status_text = st.empty()
             
             # Initialize database and load sample data
-            from utils.database import init_db
             try:
                 # Step 1: Initialize database
                 status_text.info("⏳ Setting up database...")
-                init_db()
+                _init_database()
                 progress_bar.progress(25)
                 
                 # Step 2: Check for existing data or generate sample data
                 status_text.info("⏳ Preparing EV adoption data...")
-                st.session_state.data = load_sample_data()
+                st.session_state.data = _cached_load_sample_data()
                 progress_bar.progress(50)
                 
                 # Step 3: Process and clean data
                 status_text.info("⏳ Processing and analyzing data...")
-                st.session_state.cleaned_data = clean_data(st.session_state.data)
+                st.session_state.cleaned_data = _cached_clean(st.session_state.data)
+                st.session_state.aggs_future = _get_aggregate_executor().submit(build_aggregates, st.session_state.cleaned_data)
                 progress_bar.progress(75)
                 
                 # Step 4: Extract metadata
                 status_text.info("⏳ Extracting metadata and preparing visualizations...")
-                st.session_state.regions, st.session_state.years = get_data_metadata()
+                # Computed once from the loaded data; reruns read them from session state
+                st.session_state.regions, st.session_state.years = extract_metadata(st.session_state.cleaned_data)
                 
-                if not st.session_state.regions or not st.session_state.years:
-                    # Fallback if metadata wasn't retrieved correctly
-                    st.session_state.regions = st.session_state.cleaned_data['region'].unique().tolist()
-                    st.session_state.years = sorted(st.session_state.cleaned_data['year'].unique().tolist())
+                # Years are sorted, so the bounds are the first and last entries
+                st.session_state.year_min = st.session_state.years[0]
+                st.session_state.year_max = st.session_state.years[-1]
+                st.session_state.data_summary = format_data_summary(
+                    len(st.session_state.data),
+                    len(st.session_state.regions),
+                    st.session_state.year_min,
+                    st.session_state.year_max
+                )
                 
                 # Complete the loading process
                 progress_bar.progress(100)
-                status_text.success(f"✅ Dashboard ready! Loaded data for {len(st.session_state.regions)} regions from {min(st.session_state.years)} to {max(st.session_state.years)}")
-                
-                # Add quick stats
-                col1, col2, col3 = st.columns(3)
-                col1.metric("Total Records", f"{len(st.session_state.data):,}")
-                col2.metric("Regions", f"{len(st.session_state.regions)}")
-                col3.metric("Time Period", f"{min(st.session_state.years)} - {max(st.session_state.years)}")
                 
-                # Add a small delay for user to see the completion
-                import time
-                time.sleep(1.5)
-                
-                # Remove the loading animation after completion
+                # Confirm with a non-blocking toast and remove the loading animation
+                st.toast(f"✅ Dashboard ready! Loaded data for {st.session_state.data_summary['regions']} regions from {st.session_state.year_min} to {st.session_state.year_max}")
                 loading_placeholder.empty()
                 
                 # Show success message in sidebar
@@ -194,68 +274,24 @@ else:
                 st.sidebar.error(f"Error loading sample data: {e}")
                 st.session_state.data = None
                 st.session_state.cleaned_data = None
-                
-                # Wait a moment to show the error
-                import time
-                time.sleep(2)
-                loading_placeholder.empty()
+                st.session_state.aggs_future = None
 
 # Data filtering options (only if data is loaded)
 if st.session_state.cleaned_data is not None:
-    st.sidebar.header("Filters")
-    
-    # Year range selector
-    if st.session_state.years:
-        min_year = min(st.session_state.years)
-        max_year = max(st.session_state.years)
-        year_range = st.sidebar.slider(
-            "Select Year Range",
-            min_value=min_year,
-            max_value=max_year,
-            value=(min_year, max_year)
-        )
-    else:
-        year_range = (2010, 2023)  # Default range if years not available
+    # Summary of the loaded dataset, formatted once at load; shown here rather
+    # than in the progress areas above, which are cleared as soon as loading ends
+    if st.session_state.data_summary is not None:
+        render_data_summary(st.session_state.data_summary)
     
-    # Region selector
-    if st.session_state.regions:
-        default_regions = st.session_state.regions[:5] if len(st.session_state.regions) > 5 else st.session_state.regions
-        selected_regions = st.sidebar.multiselect(
-            "Select Regions",
-            options=st.session_state.regions,
-            default=default_regions
-        )
-    else:
-        selected_regions = []  # Default empty selection if regions not available
-    
-    # Load filtered data directly from database
-    with st.spinner("Loading filtered data from database..."):
-        # Add loading animation container
-        loading_container = st.empty()
-        loading_container.info("⏳ Fetching data from database...")
-        
-        # Load data with progress indication
-        filtered_data = load_filtered_data(
-            min_year=year_range[0],
-            max_year=year_range[1],
-            regions=selected_regions if selected_regions else None
-        )
-        
-        # Clear loading message and display success
-        loading_container.empty()
-        if not filtered_data.empty:
-            loading_container.success(f"✅ Data loaded successfully! ({len(filtered_data)} records)")
-        else:
-            loading_container.warning("⚠️ No data found for selected filters.")
-    
-    # Calculate growth rates for filtered data
-    growth_data = calculate_growth_rates(filtered_data)
+    # Filters run as a fragment so their widgets rerun only the filter section
+    with st.sidebar:
+        _render_filters()
     
     # Navigation between pages
     st.sidebar.header("Navigation")
     page = st.sidebar.radio(
         "Go to Page",
-        ["Overview", "Regional Analysis", "Market Share", "Forecasting"],
+        list(PAGES),
         index=0
     )
     
@@ -269,19 +305,8 @@ if st.session_state.cleaned_data is not None:
             st.sidebar.write(f"Data shape: {st.session_state.cleaned_data.shape}")
             st.sidebar.write(f"Columns: {st.session_state.cleaned_data.columns.tolist()}")
     
-    # Display the selected page
-    try:
-        if page == "Overview":
-            overview_page()
-        elif page == "Regional Analysis":
-            regional_analysis_page()
-        elif page == "Market Share":
-            market_share_page()
-        elif page == "Forecasting":
-            forecasting_page()
-    except Exception as e:
-        st.error(f"Error loading page: {str(e)}")
-        st.code(str(e), language="python")
+    # Display the selected page as a fragment, so page widgets skip the app shell
+    _render_page(page)
 else:
     st.info("Please load data to begin analysis.")
 
@@ -1,16 +1,23 @@
 import pandas as pd
 import numpy as np
 
-def generate_sample_data():
+def generate_sample_data(seed=0):
     """
     Generates realistic sample data for EV adoption based on real-world trends.
     This is used when no external data is provided.
     
+    Args:
+        seed (int): Seed for the random noise, so repeated calls (and cached
+            results) produce the same data
+    
     Returns:
         pandas.DataFrame: Sample EV adoption data
     """
+    # Single random generator for all noise in the dataset
+    rng = np.random.default_rng(seed)
+    
     # Base years for the dataset
-    years = list(range(2010, 2024))
+    years = np.arange(2010, 2024)
     
     # Define regions with different adoption patterns
     regions = [
@@ -18,9 +25,6 @@ def generate_sample_data():
         'France', 'United Kingdom', 'Japan', 'South Korea', 'Canada'
     ]
     
-    # Generate data structure
-    data_records = []
-    
     # Different growth patterns for different regions
     growth_patterns = {
         'China': {'base': 5000, 'growth': 1.65, 'acceleration': 0.15, 'market_share_base': 0.1, 'market_share_growth': 0.5},
@@ -35,64 +39,54 @@ def generate_sample_data():
         'Canada': {'base': 800, 'growth': 1.48, 'acceleration': 0.09, 'market_share_base': 0.1, 'market_share_growth': 0.38}
     }
     
-    # Generate EV sales data with realistic growth patterns
-    for region in regions:
-        pattern = growth_patterns.get(region, {'base': 1000, 'growth': 1.5, 'acceleration': 0.1, 
-                                               'market_share_base': 0.1, 'market_share_growth': 0.4})
-        base = pattern['base']
-        growth_factor = pattern['growth']
-        acceleration = pattern['acceleration']
-        market_share_base = pattern['market_share_base']
-        market_share_growth = pattern['market_share_growth']
-        
-        for year in years:
-            # Calculate years since start
-            years_since_start = year - 2010
-            
-            # Simulate exponential growth with acceleration
-            growth_multiplier = growth_factor ** (years_since_start * (1 + acceleration * years_since_start / 10))
-            sales = int(base * growth_multiplier)
-            
-            # Add some noise for realism
-            sales = int(sales * np.random.normal(1, 0.1))
-            
-            # Ensure minimum sales
-            sales = max(10, sales)
-            
-            # Generate realistic market share
-            # Market share grows with a logistic pattern, starting slow, accelerating, then slowing as it approaches limits
-            years_factor = years_since_start / 10  # Normalize to 0-1 range over decade
-            market_share = market_share_base * (1 + market_share_growth) ** years_factor
-            
-            # Add noise to market share
-            market_share = market_share * np.random.normal(1, 0.05)
-            
-            # Cap market share at 100%
-            market_share = min(100, market_share)
-            
-            # Create data record
-            record = {
-                'year': year,
-                'region': region,
-                'sales': sales,
-                'market_share': market_share
-            }
-            
-            data_records.append(record)
-    
-    # Create DataFrame
-    df = pd.DataFrame(data_records)
-    
-    # Add vehicle type data for a subset of the records
-    df['vehicle_type'] = np.random.choice(['BEV', 'PHEV'], size=len(df), p=[0.7, 0.3])
+    default_pattern = {'base': 1000, 'growth': 1.5, 'acceleration': 0.1,
+                       'market_share_base': 0.1, 'market_share_growth': 0.4}
+    
+    # Stack pattern parameters into (regions, 1) columns so they broadcast against years
+    def pattern_column(key):
+        return np.array([growth_patterns.get(region, default_pattern)[key] for region in regions])[:, None]
+    
+    base = pattern_column('base')
+    growth_factor = pattern_column('growth')
+    acceleration = pattern_column('acceleration')
+    market_share_base = pattern_column('market_share_base')
+    market_share_growth = pattern_column('market_share_growth')
+    
+    # Years since start as a (1, years) row
+    years_since_start = (years - 2010)[None, :]
+    shape = (len(regions), len(years))
+    
+    # Simulate exponential growth with acceleration
+    growth_multiplier = growth_factor ** (years_since_start * (1 + acceleration * years_since_start / 10))
+    sales = np.trunc(base * growth_multiplier)
+    
+    # Add some noise for realism and ensure minimum sales
+    sales = np.maximum(10, (sales * rng.normal(1, 0.1, size=shape)).astype(np.int64))
+    
+    # Generate realistic market share
+    # Market share grows with a logistic pattern, starting slow, accelerating, then slowing as it approaches limits
+    years_factor = years_since_start / 10  # Normalize to 0-1 range over decade
+    market_share = market_share_base * (1 + market_share_growth) ** years_factor
+    
+    # Add noise to market share and cap it at 100%
+    market_share = np.minimum(100, market_share * rng.normal(1, 0.05, size=shape))
+    
+    # Create DataFrame from flattened (region, year) grids, using the
+    # smallest dtypes that hold each column
+    df = pd.DataFrame({
+        'year': np.tile(years, len(regions)).astype(np.int16),
+        'region': pd.Categorical.from_codes(np.repeat(np.arange(len(regions)), len(years)), regions),
+        'sales': sales.ravel().astype(np.int32),
+        'market_share': market_share.ravel().astype(np.float32)
+    }, copy=False)
+    
+    # Add vehicle type data, drawn as integer codes and stored as categoricals
+    type_codes = rng.choice(2, size=len(df), p=[0.7, 0.3])
+    df['vehicle_type'] = pd.Categorical.from_codes(type_codes, ['BEV', 'PHEV'])
     
     # Generate vehicle segment data
     segments = ['Sedan', 'SUV', 'Hatchback', 'Truck', 'Van']
-    df['vehicle_segment'] = np.random.choice(segments, size=len(df), p=[0.3, 0.4, 0.15, 0.1, 0.05])
-    
-    # Ensure data types
-    df['year'] = df['year'].astype(int)
-    df['sales'] = df['sales'].astype(int)
-    df['market_share'] = df['market_share'].astype(float)
+    segment_codes = rng.choice(len(segments), size=len(df), p=[0.3, 0.4, 0.15, 0.1, 0.05])
+    df['vehicle_segment'] = pd.Categorical.from_codes(segment_codes, segments)
     
     return df
@@ -1,14 +1,104 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-import plotly.figure_factory as ff
-from utils.data_processor import calculate_market_share, get_top_regions, calculate_growth_rates
+from utils.data_processor import calculate_market_share, get_top_regions, build_aggregates, select_rows
 from utils.data_visualizer import (plot_global_trends, plot_regional_comparison, 
-                                  create_choropleth_map, plot_market_share_evolution, 
-                                  create_stacked_area_chart, plot_growth_rates)
+                                  create_choropleth_map, plot_market_share_evolution)
 from utils.forecasting import forecast_linear, forecast_polynomial, forecast_by_region, plot_forecast
+from utils.downsample import downsample_series
+
+# Cache assembled figures so reruns with unchanged inputs skip figure construction.
+# Cached values are copies, so callers can still add shapes to the returned figure.
+_cache_figure = st.cache_data(show_spinner=False, max_entries=16)
+plot_global_trends = _cache_figure(plot_global_trends)
+plot_regional_comparison = _cache_figure(plot_regional_comparison)
+create_choropleth_map = _cache_figure(create_choropleth_map)
+plot_market_share_evolution = _cache_figure(plot_market_share_evolution)
+plot_forecast = _cache_figure(plot_forecast)
+
+# Forecasts depend only on their input data and settings, so threshold widgets
+# such as the milestone target reuse the fitted results instead of refitting
+_cache_forecast = st.cache_data(show_spinner=False, max_entries=32)
+forecast_linear = _cache_forecast(forecast_linear)
+forecast_polynomial = _cache_forecast(forecast_polynomial)
+forecast_by_region = _cache_forecast(forecast_by_region)
+
+# Display-only charts skip Plotly's hover/zoom handlers and mode bar
+_STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+def _get_aggregates(data):
+    """Returns the aggregates precomputed at load time, building them inline if missing."""
+    future = st.session_state.get('aggs_future')
+    if future is None:
+        return build_aggregates(data)
+    return future.result()
+
+# Figures built inline by the pages, cached the same way as the plotting helpers above
+@_cache_figure
+def _ev_type_pie_figure(latest_year_data, latest_year):
+    # Build the pie trace from the summed series directly, skipping Plotly Express's own grouping
+    vehicle_type_sales = latest_year_data.groupby('ev_type', observed=True)['sales'].sum()
+    fig = go.Figure(go.Pie(
+        labels=vehicle_type_sales.index.astype(str),
+        values=vehicle_type_sales.to_numpy(),
+        marker=dict(colors=px.colors.qualitative.Set2)
+    ))
+    fig.update_layout(title=f'EV Types Distribution ({latest_year})')
+    return fig
+
+@_cache_figure
+def _top_regions_bar_figure(data, metric, title, metric_label, ticksuffix=None):
+    fig = px.bar(
+        data,
+        x=metric,
+        y='region',
+        orientation='h',
+        title=title,
+        labels={metric: metric_label, 'region': 'Region'},
+        color=metric,
+        color_continuous_scale=px.colors.sequential.Viridis
+    )
+    if ticksuffix:
+        fig.update_layout(xaxis_ticksuffix=ticksuffix)
+    return fig
+
+@_cache_figure
+def _region_trends_figure(data, metric, title, metric_label, ticksuffix=None, max_points=1200):
+    # Cap the points drawn per region (LTTB downsampled); sorted so each region's series runs in year order
+    data = downsample_series(data.sort_values(['region', 'year']), 'year', metric, max_points, group_col='region')
+    fig = px.line(
+        data, 
+        x='year', 
+        y=metric, 
+        color='region',
+        # Markers only help tell a few overlaid lines apart; beyond that they just add payload
+        markers=data['region'].nunique() <= 3,
+        title=title,
+        labels={metric: metric_label, 'year': 'Year', 'region': 'Region'},
+        render_mode='webgl'
+    )
+    if ticksuffix:
+        fig.update_layout(yaxis_ticksuffix=ticksuffix)
+    return fig
+
+@_cache_figure
+def _regional_forecast_figure(regional_forecasts, forecast_metric, title):
+    fig = px.line(
+        regional_forecasts,
+        x='year',
+        y=forecast_metric,
+        color='region',
+        line_dash='type',
+        title=title,
+        labels={forecast_metric: forecast_metric.capitalize(), 'year': 'Year'},
+        render_mode='webgl'
+    )
+    
+    # Customize line styles; Plotly Express names the dashed traces "<region>, forecast"
+    fig.update_traces(line_width=2, selector=lambda trace: trace.name.endswith(', forecast'))
+    
+    return fig
 
 # Overview page functionality
 def overview_page():
@@ -24,16 +114,20 @@ def overview_page():
     st.subheader("Key Metrics")
     col1, col2, col3, col4 = st.columns(4)
     
+    aggregates = _get_aggregates(data)
+    
     # Latest year in the data
-    latest_year = data['year'].max()
+    latest_year = aggregates['latest_year']
+    latest_year_data = aggregates['latest']
     
-    # Total EV sales in the latest year
-    total_sales = data[data['year'] == latest_year]['sales'].sum()
+    # Total EV sales in the latest year, read from the precomputed yearly totals
+    sales_by_year = aggregates['sales_by_year']
+    total_sales = sales_by_year.get(latest_year, 0)
     col1.metric("Total EV Sales (Latest Year)", f"{total_sales:,.0f}")
     
     # Growth from previous year
     prev_year = latest_year - 1
-    prev_year_sales = data[data['year'] == prev_year]['sales'].sum()
+    prev_year_sales = sales_by_year.get(prev_year, 0)
     
     if prev_year_sales > 0:
         growth_pct = (total_sales - prev_year_sales) / prev_year_sales * 100
@@ -42,19 +136,21 @@ def overview_page():
         col2.metric("Year-over-Year Growth", "N/A")
     
     # Number of regions
-    region_count = data['region'].nunique()
-    col3.metric("Regions Analyzed", region_count)
-    
-    # Top region by sales
-    top_region_data = get_top_regions(data, latest_year, 'sales', 1)
-    if not top_region_data.empty:
-        top_region = top_region_data.iloc[0]['region']
-        top_region_sales = top_region_data.iloc[0]['sales']
+    col3.metric("Regions Analyzed", aggregates['region_count'])
+    
+    # Top region by sales, read from the precomputed (year, region) totals
+    by_year_region = aggregates['by_year_region']
+    if not by_year_region.empty:
+        region_sales = by_year_region.loc[latest_year, 'sales']
+        top_region = region_sales.idxmax()
+        top_region_sales = region_sales[top_region]
         col4.metric("Top Region", f"{top_region} ({top_region_sales:,.0f} units)")
     
     # Global trends chart
     st.subheader("Global EV Adoption Trend")
-    fig = plot_global_trends(data, 'sales', 'Global EV Sales Over Time')
+    # Chart the precomputed yearly totals; the figure cache then hashes a few rows
+    # instead of the full data on every rerun
+    fig = plot_global_trends(sales_by_year.reset_index(), 'sales', 'Global EV Sales Over Time')
     st.plotly_chart(fig, use_container_width=True)
     
     # Show market share if available
@@ -68,22 +164,14 @@ def overview_page():
     col1, col2 = st.columns(2)
     
     with col1:
-        latest_year_data = data[data['year'] == latest_year]
         fig = plot_regional_comparison(latest_year_data, latest_year, 'sales')
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         if 'ev_type' in data.columns:
             # Vehicle type distribution
-            vehicle_type_data = data[data['year'] == latest_year].groupby('ev_type')['sales'].sum().reset_index()
-            fig = px.pie(
-                vehicle_type_data, 
-                values='sales', 
-                names='ev_type',
-                title=f'EV Types Distribution ({latest_year})',
-                color_discrete_sequence=px.colors.qualitative.Set2
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _ev_type_pie_figure(latest_year_data, latest_year)
+            st.plotly_chart(fig, use_container_width=True, config=_STATIC_CHART_CONFIG)
 
 # Regional analysis page functionality
 def regional_analysis_page():
@@ -98,11 +186,14 @@ def regional_analysis_page():
     # Map visualization
     st.subheader("Geographic Distribution")
     
-    # Year selector for the map
-    years = sorted(data['year'].unique())
+    # Year selector for the map; the sorted years were extracted once at load
+    years = st.session_state.years
     selected_year = st.select_slider("Select Year for Map", options=years, value=years[-1])
     
-    year_data = data[data['year'] == selected_year]
+    aggregates = _get_aggregates(data)
+    
+    # Slice the precomputed (year, region) totals instead of regrouping the full data
+    year_data = aggregates['by_year_region'].loc[selected_year].reset_index()
     
     # Create and display choropleth map
     fig = create_choropleth_map(year_data, 'sales', f'EV Sales by Region ({selected_year})')
@@ -114,87 +205,173 @@ def regional_analysis_page():
     # Metric selector
     metric = st.radio("Select Metric", ["Sales Volume", "Year-over-Year Growth"], horizontal=True)
     
+    # Growth rates are computed once per dataset with the other aggregates; only
+    # the growth views read them
+    growth_data = aggregates['growth'] if metric == "Year-over-Year Growth" else None
+    
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Top Regions")
         
         if metric == "Sales Volume":
-            top_regions = get_top_regions(data, selected_year, 'sales', 10)
+            # Rank within the year's indexed rows rather than scanning the full data
+            year_rows = select_rows(data, aggregates['year_positions'], selected_year)
+            top_regions = get_top_regions(year_rows, selected_year, 'sales', 10)
             if not top_regions.empty:
-                fig = px.bar(
-                    top_regions,
-                    x='sales',
-                    y='region',
-                    orientation='h',
-                    title=f"Top Regions by EV Sales ({selected_year})",
-                    labels={'sales': 'Sales Volume', 'region': 'Region'},
-                    color='sales',
-                    color_continuous_scale=px.colors.sequential.Viridis
+                fig = _top_regions_bar_figure(
+                    top_regions, 'sales',
+                    f"Top Regions by EV Sales ({selected_year})", 'Sales Volume'
                 )
                 st.plotly_chart(fig, use_container_width=True)
         else:
-            # Year-over-Year Growth
-            growth_data = calculate_growth_rates(data)
-            growth_year_data = growth_data[growth_data['year'] == selected_year].sort_values('growth_rate', ascending=False).head(10)
+            # Year-over-Year Growth; growth is an empty frame without columns when
+            # the data lacks the year, region or sales columns
+            if 'year' in growth_data.columns:
+                growth_year_data = growth_data[growth_data['year'] == selected_year].nlargest(10, 'growth_rate')
+            else:
+                growth_year_data = growth_data
             
             if not growth_year_data.empty:
-                fig = px.bar(
-                    growth_year_data,
-                    x='growth_rate',
-                    y='region',
-                    orientation='h',
-                    title=f"Top Regions by EV Sales Growth ({selected_year})",
-                    labels={'growth_rate': 'Growth Rate (%)', 'region': 'Region'},
-                    color='growth_rate',
-                    color_continuous_scale=px.colors.sequential.Viridis
+                fig = _top_regions_bar_figure(
+                    growth_year_data, 'growth_rate',
+                    f"Top Regions by EV Sales Growth ({selected_year})", 'Growth Rate (%)',
+                    ticksuffix="%"
                 )
-                fig.update_layout(xaxis_ticksuffix="%")
                 st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("Regional Trends")
         
         # Region selector for trend analysis
-        top_regions_list = data.groupby('region')['sales'].sum().sort_values(ascending=False).head(10).index.tolist()
+        top_regions_list = aggregates['top_regions']
         selected_regions = st.multiselect(
             "Select Regions to Compare",
-            options=sorted(data['region'].unique()),
+            options=aggregates['regions'],
             default=top_regions_list[:5] if top_regions_list else None
         )
         
         if selected_regions:
-            region_data = data[data['region'].isin(selected_regions)]
-            
             if metric == "Sales Volume":
-                fig = px.line(
-                    region_data, 
-                    x='year', 
-                    y='sales', 
-                    color='region',
-                    markers=True,
-                    title='EV Sales Trends by Region',
-                    labels={'sales': 'Sales Volume', 'year': 'Year', 'region': 'Region'}
-                )
+                # Select the regions' (region, year) totals, computed once per dataset,
+                # instead of masking and regrouping the full data
+                region_data = aggregates['by_region_year'].loc[selected_regions, 'sales'].reset_index()
+                fig = _region_trends_figure(region_data, 'sales', 'EV Sales Trends by Region', 'Sales Volume')
                 st.plotly_chart(fig, use_container_width=True)
             else:
                 # Growth rate trends
-                growth_data = calculate_growth_rates(data)
-                region_growth_data = growth_data[growth_data['region'].isin(selected_regions)]
+                if 'region' in growth_data.columns:
+                    region_growth_data = growth_data[growth_data['region'].isin(selected_regions)]
+                else:
+                    region_growth_data = growth_data
                 
                 if not region_growth_data.empty:
-                    fig = px.line(
-                        region_growth_data, 
-                        x='year', 
-                        y='growth_rate', 
-                        color='region',
-                        markers=True,
-                        title='EV Sales Growth Trends by Region',
-                        labels={'growth_rate': 'Growth Rate (%)', 'year': 'Year', 'region': 'Region'}
+                    fig = _region_trends_figure(
+                        region_growth_data, 'growth_rate', 'EV Sales Growth Trends by Region',
+                        'Growth Rate (%)', ticksuffix="%"
                     )
-                    fig.update_layout(yaxis_ticksuffix="%")
                     st.plotly_chart(fig, use_container_width=True)
 
+@st.fragment
+def _market_share_by_year_section(data, aggregates):
+    """Regional market share for a chosen year; the year slider reruns only this section."""
+    # Regional market share comparison
+    st.subheader("Regional Market Share Comparison")
+    
+    # Year selector; the sorted years were extracted once at load
+    years = st.session_state.years
+    selected_year = st.select_slider("Select Year", options=years, value=years[-1])
+    
+    year_data = select_rows(data, aggregates['year_positions'], selected_year)
+    
+    fig = plot_regional_comparison(year_data, selected_year, 'market_share')
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def _milestone_calculator_section(data, aggregates):
+    """Market share milestone calculator; its inputs rerun only this section."""
+    # Market share milestone calculator
+    st.subheader("Market Share Milestone Calculator")
+    st.markdown("""
+    This tool calculates when specific regions might reach important EV market share milestones
+    based on historical growth patterns.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Region selection
+        available_regions = aggregates['regions']
+        calc_region = st.selectbox("Select Region", options=available_regions)
+        
+        # Target market share
+        target_share = st.slider("Target Market Share (%)", min_value=10, max_value=100, value=50, step=5)
+        
+        # Model type
+        model_type = st.radio("Forecasting Model", ["Linear", "Polynomial"], horizontal=True)
+        
+    with col2:
+        if calc_region:
+            region_data = select_rows(data, aggregates['region_positions'], calc_region)
+            
+            if 'market_share' in region_data.columns and not region_data.empty:
+                # Mean share per year in one grouping pass, read for the latest and previous years
+                yearly_share = region_data.groupby('year', sort=True)['market_share'].mean()
+                latest_year = yearly_share.index[-1]
+                latest_share = yearly_share.iloc[-1]
+                previous_share = yearly_share.get(latest_year - 1)
+                
+                st.metric("Current Market Share", f"{latest_share:.1f}%", 
+                         f"{latest_share - previous_share:.1f}% from previous year" 
+                         if previous_share is not None else None)
+                
+                # Calculate forecast
+                forecast_periods = 30  # Look ahead up to 30 years
+                
+                # Only the projected values are used here, so the fit is not scored
+                if model_type == "Linear":
+                    forecast_df, _, _ = forecast_linear(region_data, 'year', 'market_share', forecast_periods, compute_metrics=False)
+                else:
+                    forecast_df, _, _ = forecast_polynomial(region_data, 'year', 'market_share', forecast_periods, compute_metrics=False)
+                
+                if not forecast_df.empty:
+                    # Find when target is reached
+                    future_data = forecast_df[forecast_df['type'] == 'forecast']
+                    target_reached = future_data[future_data['market_share'] >= target_share]
+                    
+                    if not target_reached.empty:
+                        target_year = int(target_reached.iloc[0]['year'])
+                        target_value = target_reached.iloc[0]['market_share']
+                        years_to_target = target_year - latest_year
+                        
+                        st.success(f"Based on current trends, {calc_region} could reach {target_share}% EV market share by **{target_year}** ({years_to_target} years from now).")
+                        
+                        # Show forecast chart
+                        fig = plot_forecast(forecast_df, 'year', 'market_share', 
+                                          f'Market Share Forecast for {calc_region}')
+                        
+                        # Add a target line
+                        fig.add_hline(y=target_share, line_dash="dash", line_color="green",
+                                    annotation_text=f"Target: {target_share}%")
+                        
+                        st.plotly_chart(fig, use_container_width=True)
+                    else:
+                        st.warning(f"The target of {target_share}% may not be reached within the next {forecast_periods} years based on current trends.")
+                        
+                        # Still show the forecast chart
+                        fig = plot_forecast(forecast_df, 'year', 'market_share', 
+                                          f'Market Share Forecast for {calc_region}')
+                        
+                        # Add a target line
+                        fig.add_hline(y=target_share, line_dash="dash", line_color="green",
+                                    annotation_text=f"Target: {target_share}%")
+                        
+                        st.plotly_chart(fig, use_container_width=True)
+                else:
+                    st.error("Unable to create forecast with the available data. Try a different region or model type.")
+            else:
+                st.error("Market share data is not available for this region.")
+
 # Market share page functionality
 def market_share_page():
     st.header("EV Market Share Analysis")
@@ -208,6 +385,9 @@ def market_share_page():
     # Calculate market share if not already present
     if 'market_share' not in data.columns and 'total_vehicle_sales' in data.columns:
         data = calculate_market_share(data)
+        aggregates = build_aggregates(data)
+    else:
+        aggregates = _get_aggregates(data)
     
     # Check if market share data is available
     if 'market_share' in data.columns:
@@ -216,95 +396,9 @@ def market_share_page():
         fig = plot_market_share_evolution(data)
         st.plotly_chart(fig, use_container_width=True)
         
-        # Regional market share comparison
-        st.subheader("Regional Market Share Comparison")
-        
-        # Year selector
-        years = sorted(data['year'].unique())
-        selected_year = st.select_slider("Select Year", options=years, value=years[-1])
-        
-        year_data = data[data['year'] == selected_year]
-        
-        fig = plot_regional_comparison(year_data, selected_year, 'market_share')
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Market share milestone calculator
-        st.subheader("Market Share Milestone Calculator")
-        st.markdown("""
-        This tool calculates when specific regions might reach important EV market share milestones
-        based on historical growth patterns.
-        """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Region selection
-            available_regions = sorted(data['region'].unique())
-            calc_region = st.selectbox("Select Region", options=available_regions)
-            
-            # Target market share
-            target_share = st.slider("Target Market Share (%)", min_value=10, max_value=100, value=50, step=5)
-            
-            # Model type
-            model_type = st.radio("Forecasting Model", ["Linear", "Polynomial"], horizontal=True)
-            
-        with col2:
-            if calc_region:
-                region_data = data[data['region'] == calc_region]
-                
-                if 'market_share' in region_data.columns and not region_data.empty:
-                    latest_year = region_data['year'].max()
-                    latest_share = region_data[region_data['year'] == latest_year]['market_share'].values[0]
-                    
-                    st.metric("Current Market Share", f"{latest_share:.1f}%", 
-                             f"{latest_share - region_data[region_data['year'] == latest_year-1]['market_share'].values[0]:.1f}% from previous year" 
-                             if latest_year > region_data['year'].min() else None)
-                    
-                    # Calculate forecast
-                    forecast_periods = 30  # Look ahead up to 30 years
-                    
-                    if model_type == "Linear":
-                        forecast_df, metrics, _ = forecast_linear(region_data, 'year', 'market_share', forecast_periods)
-                    else:
-                        forecast_df, metrics, _ = forecast_polynomial(region_data, 'year', 'market_share', forecast_periods)
-                    
-                    if not forecast_df.empty:
-                        # Find when target is reached
-                        future_data = forecast_df[forecast_df['type'] == 'forecast']
-                        target_reached = future_data[future_data['market_share'] >= target_share]
-                        
-                        if not target_reached.empty:
-                            target_year = int(target_reached.iloc[0]['year'])
-                            target_value = target_reached.iloc[0]['market_share']
-                            years_to_target = target_year - latest_year
-                            
-                            st.success(f"Based on current trends, {calc_region} could reach {target_share}% EV market share by **{target_year}** ({years_to_target} years from now).")
-                            
-                            # Show forecast chart
-                            fig = plot_forecast(forecast_df, 'year', 'market_share', 
-                                              f'Market Share Forecast for {calc_region}')
-                            
-                            # Add a target line
-                            fig.add_hline(y=target_share, line_dash="dash", line_color="green",
-                                        annotation_text=f"Target: {target_share}%")
-                            
-                            st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.warning(f"The target of {target_share}% may not be reached within the next {forecast_periods} years based on current trends.")
-                            
-                            # Still show the forecast chart
-                            fig = plot_forecast(forecast_df, 'year', 'market_share', 
-                                              f'Market Share Forecast for {calc_region}')
-                            
-                            # Add a target line
-                            fig.add_hline(y=target_share, line_dash="dash", line_color="green",
-                                        annotation_text=f"Target: {target_share}%")
-                            
-                            st.plotly_chart(fig, use_container_width=True)
-                    else:
-                        st.error("Unable to create forecast with the available data. Try a different region or model type.")
-                else:
-                    st.error("Market share data is not available for this region.")
+        # Regional market share comparison and milestone calculator rerun independently
+        _market_share_by_year_section(data, aggregates)
+        _milestone_calculator_section(data, aggregates)
     else:
         st.warning("Market share data is not available. Please upload data that includes total vehicle sales.")
         
@@ -330,7 +424,7 @@ def market_share_page():
             labels={'market_share': 'Market Share (%)', 'year': 'Year'}
         )
         fig.update_layout(yaxis_ticksuffix="%")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=_STATIC_CHART_CONFIG)
         
         st.info("Upload data with 'total_vehicle_sales' to enable market share analysis.")
 
@@ -343,6 +437,7 @@ def forecasting_page():
         return
     
     data = st.session_state.cleaned_data
+    aggregates = _get_aggregates(data)
     
     # Forecasting controls
     st.subheader("Forecast Configuration")
@@ -379,7 +474,7 @@ def forecasting_page():
     with col3:
         if forecast_scope == "Regional":
             # Region selection for regional forecasting
-            available_regions = sorted(data['region'].unique())
+            available_regions = aggregates['regions']
             selected_regions = st.multiselect(
                 "Select Regions", 
                 options=available_regions,
@@ -387,7 +482,7 @@ def forecasting_page():
             )
         else:
             # For global forecasting, include all regions
-            selected_regions = sorted(data['region'].unique())
+            selected_regions = aggregates['regions']
             st.info("Global forecast combines data from all regions")
     
     # Generate forecast
@@ -404,11 +499,7 @@ def forecasting_page():
             if forecast_scope == "Global":
                 # Aggregate data globally and forecast
                 global_data = filtered_data.groupby('year')[forecast_metric].sum().reset_index()
-                global_data = pd.DataFrame({
-                    'year': global_data['year'],
-                    forecast_metric: global_data[forecast_metric],
-                    'region': 'Global'  # Add dummy region column
-                })
+                global_data['region'] = 'Global'  # Add dummy region column
                 
                 forecast_df, metrics, _ = forecast_linear(global_data, 'year', forecast_metric, periods)
                 
@@ -429,21 +520,10 @@ def forecasting_page():
                 
                 if not regional_forecasts.empty:
                     # Plot multi-region forecast
-                    fig = px.line(
-                        regional_forecasts,
-                        x='year',
-                        y=forecast_metric,
-                        color='region',
-                        line_dash='type',
-                        title=f'Regional {forecast_metric.capitalize()} Forecast',
-                        labels={forecast_metric: forecast_metric.capitalize(), 'year': 'Year'}
+                    fig = _regional_forecast_figure(
+                        regional_forecasts, forecast_metric,
+                        f'Regional {forecast_metric.capitalize()} Forecast'
                     )
-                    
-                    # Customize line styles
-                    for i, trace in enumerate(fig.data):
-                        if trace.line.dash == 'forecast':
-                            trace.line.width = 2
-                    
                     st.plotly_chart(fig, use_container_width=True)
                 else:
                     st.error("Insufficient data to generate regional forecasts.")
@@ -452,11 +532,7 @@ def forecasting_page():
             if forecast_scope == "Global":
                 # Aggregate data globally and forecast
                 global_data = filtered_data.groupby('year')[forecast_metric].sum().reset_index()
-                global_data = pd.DataFrame({
-                    'year': global_data['year'],
-                    forecast_metric: global_data[forecast_metric],
-                    'region': 'Global'  # Add dummy region column
-                })
+                global_data['region'] = 'Global'  # Add dummy region column
                 
                 forecast_df, metrics, _ = forecast_polynomial(global_data, 'year', forecast_metric, periods, degree)
                 
@@ -471,35 +547,16 @@ def forecasting_page():
                     st.plotly_chart(fig, use_container_width=True)
             else:
                 # Regional polynomial forecasting
-                regional_forecasts = pd.DataFrame()  # Initialize empty DataFrame
-                
-                for region in selected_regions:
-                    region_data = filtered_data[filtered_data['region'] == region]
-                    
-                    if len(region_data) >= degree + 1:  # Ensure enough data points for the polynomial degree
-                        forecast_df, _, _ = forecast_polynomial(region_data, 'year', forecast_metric, periods, degree)
-                        
-                        if not forecast_df.empty:
-                            forecast_df['region'] = region
-                            regional_forecasts = pd.concat([regional_forecasts, forecast_df], ignore_index=True)
+                regional_forecasts = forecast_by_region(
+                    filtered_data, 'region', 'year', forecast_metric, periods, 'polynomial', degree
+                )
                 
                 if not regional_forecasts.empty:
                     # Plot multi-region forecast
-                    fig = px.line(
-                        regional_forecasts,
-                        x='year',
-                        y=forecast_metric,
-                        color='region',
-                        line_dash='type',
-                        title=f'Regional {forecast_metric.capitalize()} Forecast (Polynomial Degree {degree})',
-                        labels={forecast_metric: forecast_metric.capitalize(), 'year': 'Year'}
+                    fig = _regional_forecast_figure(
+                        regional_forecasts, forecast_metric,
+                        f'Regional {forecast_metric.capitalize()} Forecast (Polynomial Degree {degree})'
                     )
-                    
-                    # Customize line styles
-                    for i, trace in enumerate(fig.data):
-                        if trace.line.dash == 'forecast':
-                            trace.line.width = 2
-                    
                     st.plotly_chart(fig, use_container_width=True)
                 else:
                     st.error("Insufficient data to generate polynomial forecasts for the selected regions.")
@@ -2,9 +2,103 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
 from utils.forecasting import forecast_linear, forecast_polynomial, forecast_by_region, plot_forecast
 
+# Reuse fitted forecasts when the same data and settings come back on a rerun
+_cache_forecast = st.cache_data(show_spinner=False, max_entries=32)
+forecast_linear = _cache_forecast(forecast_linear)
+forecast_polynomial = _cache_forecast(forecast_polynomial)
+forecast_by_region = _cache_forecast(forecast_by_region)
+
+# Reuse the built forecast chart along with the forecast itself
+plot_forecast = st.cache_data(show_spinner=False, max_entries=16)(plot_forecast)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _global_yearly_sales(data):
+    # Computed once per dataset; forecast settings changes reuse it
+    return data.groupby('year', sort=True)['sales'].sum().reset_index()
+
+@st.fragment
+def _regional_forecasts_section(data, region_options, forecast_method, forecast_periods, polynomial_degree):
+    """Regional forecasts; changing the region selection reruns only this section,
+    not the global forecast above it."""
+    # Select regions for forecasting
+    forecast_regions = st.multiselect(
+        "Select Regions to Forecast",
+        options=region_options,
+        default=region_options[:3]
+    )
+    
+    if forecast_regions:
+        # Filter data for selected regions
+        region_data = data[data['region'].isin(forecast_regions)]
+        
+        # Perform forecasting for each region
+        method = forecast_method.lower()
+        regional_forecasts = forecast_by_region(
+            region_data,
+            'region',
+            'year',
+            'sales',
+            forecast_periods,
+            method,
+            polynomial_degree
+        )
+        
+        if not regional_forecasts.empty:
+            # Create visualization: one line per region and forecast type, built in a single call
+            fig = px.line(
+                regional_forecasts,
+                x='year',
+                y='sales',
+                color='region',
+                line_dash='type',
+                category_orders={'region': forecast_regions, 'type': ['historical', 'forecast']},
+                line_dash_map={'historical': 'solid', 'forecast': 'dash'},
+                labels={'type': 'Type', 'region': 'Region'}
+            )
+            fig.update_traces(line_width=2)
+            fig.update_traces(mode='lines+markers', selector=lambda trace: trace.name.endswith(', forecast'))
+            
+            fig.update_layout(
+                title=f'Regional EV Sales Forecasts ({forecast_method} Model)',
+                xaxis_title='Year',
+                yaxis_title='Sales',
+                hovermode='x unified',
+                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Display projections
+            st.subheader("Regional Projections")
+            
+            # Calculate projected values for milestone years
+            latest_year = st.session_state.year_max
+            milestone_years = [latest_year + 5, latest_year + 10]
+            
+            # Look every (region, milestone year) pair up in one reindex of the forecast rows
+            future_forecasts = regional_forecasts[regional_forecasts['type'] == 'forecast']
+            milestone_df = (
+                future_forecasts.pivot(index='region', columns='year', values='sales')
+                .reindex(index=forecast_regions, columns=milestone_years)
+                .stack(future_stack=True)
+                .dropna()
+                .rename_axis(['Region', 'Year'])
+                .rename('Projected Sales')
+                .reset_index()
+            )
+            milestone_df['Projected Sales'] = np.rint(milestone_df['Projected Sales']).astype(np.int64)
+            
+            if not milestone_df.empty:
+                st.table(milestone_df)
+            else:
+                st.info("No milestone projections available for the selected regions.")
+        else:
+            st.warning("Insufficient data for regional forecasting. Each region needs at least 3 years of historical data.")
+    else:
+        st.info("Please select at least one region for forecasting.")
+
 def app():
     st.title("EV Adoption Forecasting")
     
@@ -15,6 +109,10 @@ def app():
     
     data = st.session_state.cleaned_data
     
+    # Sorted region names, shared by the region selectors below; clean_data makes
+    # region categorical, so its categories are already unique and sorted
+    region_options = data['region'].cat.categories.tolist()
+    
     st.markdown("""
     This page provides forecasting of future EV adoption trends based on historical data.
     The forecasts use statistical models (linear and polynomial regression) and should be interpreted as projections
@@ -59,7 +157,7 @@ def app():
     st.header("Global EV Adoption Forecast")
     
     # Aggregate data by year
-    global_data = data.groupby('year')['sales'].sum().reset_index()
+    global_data = _global_yearly_sales(data)
     
     # Perform forecasting based on selected method
     if forecast_method == "Polynomial":
@@ -92,24 +190,19 @@ def app():
         # Display model metrics
         st.subheader("Model Metrics")
         
-        metrics_df = pd.DataFrame({
-            'Metric': list(metrics.keys()),
-            'Value': list(metrics.values())
-        })
-        
-        st.table(metrics_df)
+        # A handful of named values, shown straight from a Series keyed by metric
+        st.table(pd.Series(metrics, name='Value').rename_axis('Metric'))
         
         # Forecast table
         st.subheader("Forecast Values")
         
-        # Format the forecast data for display
-        display_forecast = forecast_df.copy()
-        display_forecast['sales'] = display_forecast['sales'].round(0).astype(int)
-        display_forecast.columns = ['Year', 'Sales', 'Type']
-        
-        # Display only future values
-        future_forecast = display_forecast[display_forecast['Type'] == 'forecast']
-        st.table(future_forecast[['Year', 'Sales']])
+        # Format only the future rows for display, without copying the historical ones
+        is_forecast = (forecast_df['type'] == 'forecast').to_numpy()
+        future_forecast = pd.DataFrame({
+            'Year': forecast_df['year'].to_numpy()[is_forecast],
+            'Sales': np.rint(forecast_df['sales'].to_numpy()[is_forecast]).astype(np.int64)
+        }, index=forecast_df.index[is_forecast])
+        st.table(future_forecast)
         
         # Add forecast insights
         st.markdown("""
@@ -124,110 +217,7 @@ def app():
     
     # Regional forecasts
     st.header("Regional Adoption Forecasts")
-    
-    # Select regions for forecasting
-    forecast_regions = st.multiselect(
-        "Select Regions to Forecast",
-        options=sorted(data['region'].unique()),
-        default=sorted(data['region'].unique())[:3] if len(data['region'].unique()) > 3 else sorted(data['region'].unique())
-    )
-    
-    if forecast_regions:
-        # Filter data for selected regions
-        region_data = data[data['region'].isin(forecast_regions)]
-        
-        # Perform forecasting for each region
-        method = forecast_method.lower()
-        regional_forecasts = forecast_by_region(
-            region_data,
-            'region',
-            'year',
-            'sales',
-            forecast_periods,
-            method
-        )
-        
-        if not regional_forecasts.empty:
-            # Create visualization
-            import plotly.graph_objects as go
-            
-            fig = go.Figure()
-            
-            # Add traces for each region and forecast type
-            for region in forecast_regions:
-                region_forecast = regional_forecasts[regional_forecasts['region'] == region]
-                
-                if region_forecast.empty:
-                    continue
-                
-                # Historical data
-                historical = region_forecast[region_forecast['type'] == 'historical']
-                forecast = region_forecast[region_forecast['type'] == 'forecast']
-                
-                # Add historical line
-                fig.add_trace(go.Scatter(
-                    x=historical['year'],
-                    y=historical['sales'],
-                    mode='lines',
-                    name=f'{region} (Historical)',
-                    line=dict(width=2)
-                ))
-                
-                # Add forecast line
-                fig.add_trace(go.Scatter(
-                    x=forecast['year'],
-                    y=forecast['sales'],
-                    mode='lines+markers',
-                    name=f'{region} (Forecast)',
-                    line=dict(dash='dash', width=2)
-                ))
-            
-            fig.update_layout(
-                title=f'Regional EV Sales Forecasts ({forecast_method} Model)',
-                xaxis_title='Year',
-                yaxis_title='Sales',
-                hovermode='x unified',
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Display projections
-            st.subheader("Regional Projections")
-            
-            # Calculate projected values for milestone years
-            latest_year = data['year'].max()
-            milestone_years = [latest_year + 5, latest_year + 10]
-            
-            milestone_data = []
-            
-            for region in forecast_regions:
-                region_forecast = regional_forecasts[
-                    (regional_forecasts['region'] == region) & 
-                    (regional_forecasts['type'] == 'forecast')
-                ]
-                
-                if region_forecast.empty:
-                    continue
-                
-                for year in milestone_years:
-                    if year in region_forecast['year'].values:
-                        projected_sales = region_forecast[region_forecast['year'] == year]['sales'].values[0]
-                        milestone_data.append({
-                            'Region': region,
-                            'Year': year,
-                            'Projected Sales': int(round(projected_sales))
-                        })
-            
-            if milestone_data:
-                milestone_df = pd.DataFrame(milestone_data)
-                st.table(milestone_df)
-            else:
-                st.info("No milestone projections available for the selected regions.")
-        else:
-            st.warning("Insufficient data for regional forecasting. Each region needs at least 3 years of historical data.")
-    else:
-        st.info("Please select at least one region for forecasting.")
+    _regional_forecasts_section(data, region_options, forecast_method, forecast_periods, polynomial_degree)
     
     # Forecast limitations
     st.header("Forecast Limitations")
@@ -3,9 +3,21 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-import plotly.figure_factory as ff
 from utils.data_visualizer import plot_market_share_evolution, create_stacked_area_chart
-from utils.data_processor import calculate_market_share
+
+# Reuse built figures when only unrelated widgets change on a rerun
+_cache_figure = st.cache_data(show_spinner=False, max_entries=8)
+plot_market_share_evolution = _cache_figure(plot_market_share_evolution)
+create_stacked_area_chart = _cache_figure(create_stacked_area_chart)
+
+# Largest heatmap (regions x years) that still gets per-cell value labels
+HEATMAP_MAX_LABELED_CELLS = 500
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _market_share_by_region_year(data):
+    # Mean market share as a region x year grid, computed once per dataset; the
+    # latest-year bar chart and the heatmap are both sliced from it
+    return data.groupby(['region', 'year'], observed=True)['market_share'].mean().unstack('year')
 
 def app():
     st.title("EV Market Share Analysis")
@@ -17,6 +29,10 @@ def app():
     
     data = st.session_state.cleaned_data
     
+    # Sorted region names, shared by the region selectors below; clean_data makes
+    # region categorical, so its categories are already unique and sorted
+    region_options = data['region'].cat.categories.tolist()
+    
     st.markdown("""
     This page analyzes the market penetration of electric vehicles over time,
     examining what percentage of new vehicle sales are electric and how this varies by region.
@@ -47,12 +63,17 @@ def app():
         # Market share comparison by region for latest year
         st.header("Market Share Comparison by Region")
         
-        latest_year = data['year'].max()
-        latest_data = data[data['year'] == latest_year]
+        market_share_grid = _market_share_by_region_year(data)
         
-        # Group by region and calculate average market share
-        region_market = latest_data.groupby('region')['market_share'].mean().reset_index()
-        region_market = region_market.sort_values('market_share', ascending=False)
+        # Average market share by region in the latest year
+        latest_year = market_share_grid.columns.max()
+        region_market = (
+            market_share_grid[latest_year]
+            .dropna()
+            .sort_values(ascending=False)
+            .rename('market_share')
+            .reset_index()
+        )
         
         # Create bar chart
         market_bar_fig = px.bar(
@@ -65,10 +86,9 @@ def app():
             color_continuous_scale='Viridis'
         )
         
-        market_bar_fig.update_layout(
-            xaxis={'categoryorder': 'total descending'},
-            hovermode='closest'
-        )
+        # Rows are already sorted by value, so the bars keep that order without a
+        # client-side category re-sort
+        market_bar_fig.update_layout(hovermode='closest')
         
         st.plotly_chart(market_bar_fig, use_container_width=True)
         
@@ -78,30 +98,35 @@ def app():
         # Select regions for heatmap
         heatmap_regions = st.multiselect(
             "Select Regions for Heatmap",
-            options=sorted(data['region'].unique()),
-            default=sorted(data['region'].unique())[:10] if len(data['region'].unique()) > 10 else sorted(data['region'].unique())
+            options=region_options,
+            default=region_options[:10]
         )
         
         if heatmap_regions:
-            # Filter data for selected regions
-            heatmap_data = data[data['region'].isin(heatmap_regions)]
-            
-            # Group by region and year, calculate mean market share
-            pivot_data = heatmap_data.groupby(['region', 'year'])['market_share'].mean().reset_index()
-            
-            # Create pivot table
-            pivot_table = pivot_data.pivot(index='region', columns='year', values='market_share').fillna(0)
+            # Slice the selected regions from the precomputed region x year grid
+            pivot_table = (
+                market_share_grid.loc[market_share_grid.index.isin(heatmap_regions)]
+                .dropna(axis=1, how='all')
+            )
             
             # Create heatmap
             if not pivot_table.empty:
-                fig = ff.create_annotated_heatmap(
-                    z=pivot_table.values,
-                    x=list(map(str, pivot_table.columns.tolist())),
+                # Cell labels are formatted from z by texttemplate, so no separate text
+                # array is built or sent; on large grids they are unreadable anyway,
+                # so hover text is enough
+                label_cells = pivot_table.size <= HEATMAP_MAX_LABELED_CELLS
+                # Dense float32 matrix with gaps zero-filled in place, so the figure
+                # ships a compact typed array and no filled copy of the frame is made
+                z = np.nan_to_num(pivot_table.to_numpy(dtype=np.float32), copy=False)
+                fig = go.Figure(go.Heatmap(
+                    z=z,
+                    x=pivot_table.columns.astype(str),
                     y=pivot_table.index.tolist(),
-                    annotation_text=np.around(pivot_table.values, 1),
+                    texttemplate="%{z:.1f}" if label_cells else None,
+                    hovertemplate="%{y} %{x}: %{z:.2f}%<extra></extra>",
                     colorscale='Viridis',
                     showscale=True
-                )
+                ))
                 
                 fig.update_layout(
                     title='EV Market Share by Region and Year (%)',
@@ -198,21 +223,22 @@ def app():
         # Select region to analyze
         calc_region = st.selectbox(
             "Select Region to Analyze",
-            options=sorted(data['region'].unique()),
+            options=region_options,
             index=0
         )
         
-        # Filter data for selected region
-        region_data = data[data['region'] == calc_region]
+        # Mean market share per year for the region, read from the cached region x
+        # year grid; the first and last entries give the earliest and latest years
+        yearly_share = market_share_grid.loc[calc_region].dropna().sort_index()
         
         # Get the latest market share
-        latest_year = region_data['year'].max()
-        latest_market_share = region_data[region_data['year'] == latest_year]['market_share'].mean()
+        latest_year = yearly_share.index[-1]
+        latest_market_share = yearly_share.iloc[-1]
         
         # Calculate average annual growth in percentage points
-        if len(region_data['year'].unique()) > 1:
-            earliest_year = region_data['year'].min()
-            earliest_market_share = region_data[region_data['year'] == earliest_year]['market_share'].mean()
+        if len(yearly_share) > 1:
+            earliest_year = yearly_share.index[0]
+            earliest_market_share = yearly_share.iloc[0]
             years_diff = latest_year - earliest_year
             
             if years_diff > 0:
@@ -256,28 +282,20 @@ def app():
                 # Display milestone projections
                 st.subheader(f"Projected Years to Reach Milestones for {calc_region}")
                 
-                milestone_df = pd.DataFrame({
+                # Four rows, passed to st.table as plain columns
+                st.table({
                     'Milestone': [f"{m}% Market Share" for m in milestones],
                     'Projected Year': [milestone_years[m] for m in milestones]
                 })
                 
-                st.table(milestone_df)
-                
-                # Display projection chart
-                projection_years = range(latest_year, latest_year + 31)
-                projection_data = []
-                
-                for year in projection_years:
-                    years_from_now = year - latest_year
-                    projected_share = min(100, latest_market_share + (years_from_now * adjusted_growth))
-                    
-                    projection_data.append({
-                        'Year': year,
-                        'Projected Market Share': projected_share,
-                        'Type': 'Historical' if year == latest_year else 'Projected'
-                    })
-                
-                projection_df = pd.DataFrame(projection_data)
+                # Display projection chart, projecting all 31 years in one array expression
+                projection_years = np.arange(latest_year, latest_year + 31, dtype=np.int32)
+                years_from_now = projection_years - latest_year
+                projection_df = pd.DataFrame({
+                    'Year': projection_years,
+                    'Projected Market Share': np.minimum(100, latest_market_share + years_from_now * adjusted_growth),
+                    'Type': np.where(years_from_now == 0, 'Historical', 'Projected')
+                })
                 
                 fig = px.line(
                     projection_df, 
@@ -286,7 +304,8 @@ def app():
                     color='Type',
                     title=f'Projected Market Share for {calc_region}',
                     labels={'Projected Market Share': 'Market Share (%)'},
-                    color_discrete_map={'Historical': 'blue', 'Projected': 'red'}
+                    color_discrete_map={'Historical': 'blue', 'Projected': 'red'},
+                    render_mode='webgl'
                 )
                 
                 # Add milestone lines
@@ -294,16 +313,16 @@ def app():
                     if latest_market_share < milestone:
                         fig.add_shape(
                             type="line",
-                            x0=min(projection_years),
+                            x0=int(projection_years[0]),
                             y0=milestone,
-                            x1=max(projection_years),
+                            x1=int(projection_years[-1]),
                             y1=milestone,
                             line=dict(color="green", width=1, dash="dash"),
                         )
                         
                         # Add milestone label
                         fig.add_annotation(
-                            x=min(projection_years) + 2,
+                            x=int(projection_years[0]) + 2,
                             y=milestone + 2,
                             text=f"{milestone}% Milestone",
                             showarrow=False,
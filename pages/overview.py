@@ -1,9 +1,21 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 from utils.data_visualizer import plot_global_trends, plot_regional_comparison, plot_growth_rates
 from utils.data_processor import calculate_growth_rates
 
+# Growth rates only change with the data, so reruns reuse the cached result
+calculate_growth_rates = st.cache_data(show_spinner=False, max_entries=4)(calculate_growth_rates)
+
+# Reuse built figures, e.g. when the regional comparison slider returns to a year
+_cache_figure = st.cache_data(show_spinner=False, max_entries=16)
+plot_global_trends = _cache_figure(plot_global_trends)
+plot_regional_comparison = _cache_figure(plot_regional_comparison)
+plot_growth_rates = _cache_figure(plot_growth_rates)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _yearly_sales(data):
+    # Computed once per dataset; the key metrics below are lookups into it
+    return data.groupby('year', sort=True)['sales'].sum()
+
 def app():
     st.title("Global EV Adoption Overview")
     
@@ -22,13 +34,16 @@ def app():
     st.header("Key Metrics")
     col1, col2, col3 = st.columns(3)
     
-    latest_year = data['year'].max()
-    earliest_year = data['year'].min()
+    # Per-year totals every metric below reads from
+    yearly_totals = _yearly_sales(data)
+    
+    latest_year = yearly_totals.index[-1]
+    earliest_year = yearly_totals.index[0]
     total_years = latest_year - earliest_year + 1
     
     # Calculate total sales
-    total_sales = data['sales'].sum()
-    latest_year_sales = data[data['year'] == latest_year]['sales'].sum()
+    total_sales = yearly_totals.sum()
+    latest_year_sales = yearly_totals.iloc[-1]
     
     with col1:
         st.metric(
@@ -47,7 +62,7 @@ def app():
     with col3:
         # Calculate CAGR if possible
         if total_years > 1:
-            first_year_sales = data[data['year'] == earliest_year]['sales'].sum()
+            first_year_sales = yearly_totals.iloc[0]
             if first_year_sales > 0:
                 cagr = (((latest_year_sales / first_year_sales) ** (1 / (total_years - 1))) - 1) * 100
                 st.metric(
@@ -76,7 +91,9 @@ def app():
     
     with tab1:
         st.subheader("EV Sales Over Time")
-        sales_fig = plot_global_trends(data, 'sales', 'Global EV Sales Over Time')
+        # Chart the per-year totals computed above; summing them again by year is a
+        # no-op, and the figure cache hashes a few rows instead of the full data
+        sales_fig = plot_global_trends(yearly_totals.reset_index(), 'sales', 'Global EV Sales Over Time')
         st.plotly_chart(sales_fig, use_container_width=True)
         
         # Add some insights about the trend
@@ -113,9 +130,9 @@ def app():
         # Select year for comparison
         selected_year = st.slider(
             "Select Year for Regional Comparison",
-            min_value=int(data['year'].min()),
-            max_value=int(data['year'].max()),
-            value=int(data['year'].max())
+            min_value=int(earliest_year),
+            max_value=int(latest_year),
+            value=int(latest_year)
         )
         
         comparison_fig = plot_regional_comparison(data, selected_year, 'sales')
@@ -1,9 +1,28 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import plotly.express as px
+from utils.data_processor import select_rows
 from utils.data_visualizer import create_choropleth_map, plot_regional_comparison
 
+# Reuse built figures when the year sliders or metric selectors return to a setting
+_cache_figure = st.cache_data(show_spinner=False, max_entries=16)
+create_choropleth_map = _cache_figure(create_choropleth_map)
+plot_regional_comparison = _cache_figure(plot_regional_comparison)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _year_positions(data):
+    # Index the rows by year once per dataset, so each year slider is a dict lookup
+    # rather than a mask over the full data; only positions are kept, not row copies
+    return data.groupby('year', sort=False).indices
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _region_year_totals(data):
+    # Summed sales (and mean market share, if available) per (region, year) in one
+    # grouping pass per dataset; the trend charts select their regions from it
+    aggregations = {'sales': 'sum'}
+    if 'market_share' in data.columns:
+        aggregations['market_share'] = 'mean'
+    return data.groupby(['region', 'year'], observed=True, sort=False).agg(aggregations)
+
 def app():
     st.title("Regional EV Adoption Analysis")
     
@@ -14,6 +33,17 @@ def app():
     
     data = st.session_state.cleaned_data
     
+    # Sorted region names, shared by the region selectors below; clean_data makes
+    # region categorical, so its categories are already unique and sorted
+    region_options = data['region'].cat.categories.tolist()
+    
+    # Year bounds, shared by the year sliders below; computed once when the data was loaded
+    min_year = st.session_state.year_min
+    max_year = st.session_state.year_max
+    
+    # Rows of each year, shared by the map and the comparison chart
+    year_positions = _year_positions(data)
+    
     st.markdown("""
     This page provides a detailed comparison of EV adoption across different regions and countries,
     highlighting leaders and laggards in the electric vehicle transition.
@@ -25,13 +55,13 @@ def app():
     # Year selector for map
     map_year = st.slider(
         "Select Year for Map",
-        min_value=int(data['year'].min()),
-        max_value=int(data['year'].max()),
-        value=int(data['year'].max())
+        min_value=min_year,
+        max_value=max_year,
+        value=max_year
     )
     
-    # Filter data for selected year
-    year_data = data[data['year'] == map_year]
+    # Rows for the selected year (empty if the year has no data)
+    year_data = select_rows(data, year_positions, map_year)
     
     # Metric selector for map
     map_metric = st.selectbox(
@@ -62,9 +92,9 @@ def app():
     # Year selector for comparison
     comp_year = st.slider(
         "Select Year for Comparison",
-        min_value=int(data['year'].min()),
-        max_value=int(data['year'].max()),
-        value=int(data['year'].max()),
+        min_value=min_year,
+        max_value=max_year,
+        value=max_year,
         key="comp_year_slider"
     )
     
@@ -76,9 +106,9 @@ def app():
         key="comp_metric_selector"
     )
     
-    # Create bar chart comparison
+    # Create bar chart comparison from the selected year's rows
     comp_fig = plot_regional_comparison(
-        data, 
+        select_rows(data, year_positions, comp_year), 
         comp_year, 
         comp_metric
     )
@@ -90,16 +120,14 @@ def app():
     # Select regions to compare
     selected_regions = st.multiselect(
         "Select Regions to Compare",
-        options=sorted(data['region'].unique()),
-        default=sorted(data['region'].unique())[:5] if len(data['region'].unique()) > 5 else sorted(data['region'].unique())
+        options=region_options,
+        default=region_options[:5]
     )
     
     if selected_regions:
-        # Filter data for selected regions
-        region_data = data[data['region'].isin(selected_regions)]
-        
-        # Group by region and year
-        trend_data = region_data.groupby(['region', 'year'])['sales'].sum().reset_index()
+        # Select the chosen regions from the cached (region, year) totals
+        region_totals = _region_year_totals(data).loc[selected_regions]
+        trend_data = region_totals['sales'].reset_index()
         
         # Create line chart
         trend_fig = px.line(
@@ -108,7 +136,8 @@ def app():
             y='sales',
             color='region',
             labels={'sales': 'EV Sales', 'year': 'Year', 'region': 'Region'},
-            title='EV Sales Trends by Region'
+            title='EV Sales Trends by Region',
+            render_mode='webgl'
         )
         
         trend_fig.update_layout(
@@ -131,8 +160,8 @@ def app():
         if 'market_share' in data.columns:
             st.header("Market Share Comparison")
             
-            # Group by region and year for market share
-            market_data = region_data.groupby(['region', 'year'])['market_share'].mean().reset_index()
+            # Mean market share per region and year, from the same totals
+            market_data = region_totals['market_share'].reset_index()
             
             # Create line chart for market share
             market_fig = px.line(
@@ -141,7 +170,8 @@ def app():
                 y='market_share',
                 color='region',
                 labels={'market_share': 'Market Share (%)', 'year': 'Year', 'region': 'Region'},
-                title='EV Market Share Trends by Region'
+                title='EV Market Share Trends by Region',
+                render_mode='webgl'
             )
             
             market_fig.update_layout(
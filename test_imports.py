@@ -1,63 +1,46 @@
-import streamlit
-import pandas
-import numpy
-import plotly.express
-import plotly.graph_objects
-import plotly.figure_factory
-
-# Test core app imports
-try:
-    from utils.data_loader import load_sample_data
-    print("✓ Successfully imported load_sample_data")
-except Exception as e:
-    print(f"× Error importing load_sample_data: {e}")
-
-try:
-    from utils.data_processor import clean_data, calculate_growth_rates, calculate_market_share
-    print("✓ Successfully imported data_processor functions")
-except Exception as e:
-    print(f"× Error importing data_processor functions: {e}")
-
-try:
-    from utils.data_visualizer import plot_global_trends, create_choropleth_map
-    print("✓ Successfully imported data_visualizer functions")
-except Exception as e:
-    print(f"× Error importing data_visualizer functions: {e}")
-
-try:
-    from utils.forecasting import forecast_linear, forecast_polynomial, plot_forecast
-    print("✓ Successfully imported forecasting functions")
-except Exception as e:
-    print(f"× Error importing forecasting functions: {e}")
-
-# Test page imports
-try:
-    import pages.overview
-    print("✓ Successfully imported pages.overview")
-except Exception as e:
-    print(f"× Error importing pages.overview: {e}")
-
-try:
-    import pages.regional_analysis
-    print("✓ Successfully imported pages.regional_analysis")
-except Exception as e:
-    print(f"× Error importing pages.regional_analysis: {e}")
-
-try:
-    import pages.market_share
-    print("✓ Successfully imported pages.market_share")
-except Exception as e:
-    print(f"× Error importing pages.market_share: {e}")
-
-try:
-    import pages.forecasting
-    print("✓ Successfully imported pages.forecasting")
-except Exception as e:
-    print(f"× Error importing pages.forecasting: {e}")
-
-# Test sample data generation
-try:
-    from assets.sample_data import generate_sample_data
-    print("✓ Successfully imported generate_sample_data")
-except Exception as e:
-    print(f"× Error importing generate_sample_data: {e}")
\ No newline at end of file
+import importlib
+import importlib.util
+
+# Check third-party dependencies are installed without executing them; the
+# modules below import whatever they actually use
+DEPENDENCIES = ['streamlit', 'pandas', 'numpy', 'plotly']
+missing = [name for name in DEPENDENCIES if importlib.util.find_spec(name) is None]
+if missing:
+    print(f"× Missing dependencies: {', '.join(missing)}")
+
+# Module -> names it must provide (an empty tuple just imports the module)
+MODULES = {
+    # Core app modules
+    'utils.data_loader': ('load_sample_data',),
+    'utils.data_processor': ('clean_data', 'calculate_growth_rates', 'calculate_market_share'),
+    'utils.data_visualizer': ('plot_global_trends', 'create_choropleth_map'),
+    'utils.forecasting': ('forecast_linear', 'forecast_polynomial', 'plot_forecast'),
+    # Pages
+    'pages.overview': (),
+    'pages.regional_analysis': (),
+    'pages.market_share': (),
+    'pages.forecasting': (),
+    # Sample data generation
+    'assets.sample_data': ('generate_sample_data',),
+}
+
+def _safe_import(module_name, names):
+    """Imports a module and checks its names, returning the error instead of raising it."""
+    try:
+        module = importlib.import_module(module_name)
+        for name in names:
+            getattr(module, name)
+        return None
+    except Exception as e:
+        return e
+
+# Imports share the interpreter's import lock, so they run one after another;
+# failures are reported individually, followed by a single summary line
+failures = {}
+for module_name, names in MODULES.items():
+    error = _safe_import(module_name, names)
+    if error is not None:
+        failures[module_name] = error
+        print(f"× Error importing {module_name}: {error}")
+
+print(f"{'✓' if not failures else '×'} {len(MODULES) - len(failures)}/{len(MODULES)} modules imported successfully")
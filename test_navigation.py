@@ -9,13 +9,12 @@ st.title("Navigation Test App")
 if 'current_page' not in st.session_state:
     st.session_state.current_page = "Home"
 
-# Create dummy data for session state
-if 'test_data' not in st.session_state:
-    st.session_state.test_data = pd.DataFrame({
+# Create dummy data for session state, under the single key the pages read
+if 'cleaned_data' not in st.session_state:
+    st.session_state.cleaned_data = pd.DataFrame({
         'year': range(2010, 2024),
-        'sales': np.random.randint(1000, 100000, 14)
+        'sales': np.random.default_rng(0).integers(1000, 100000, 14)
     })
-    st.session_state.cleaned_data = st.session_state.test_data
 
 # Function to show home page
 def show_home():
@@ -23,7 +22,7 @@ def show_home():
     st.write("This is the home page. Use the sidebar to navigate to other pages.")
     
     # Display the test data
-    st.dataframe(st.session_state.test_data)
+    st.dataframe(st.session_state.cleaned_data)
 
 # Function to show page 1
 def show_page1():
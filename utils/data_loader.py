@@ -1,23 +1,24 @@
 import pandas as pd
-import numpy as np
 from assets.sample_data import generate_sample_data
-from utils.database import load_data_from_db, db_has_data, save_data_to_db, clear_db_data, get_db_metadata, init_db, filter_data_from_db
+from utils.database import load_data_from_db, db_has_data, save_data_to_db, replace_db_data, get_db_metadata, init_db
+
+# Columns used by the dashboard; anything else in an uploaded CSV is not parsed
+CSV_COLUMNS = ['year', 'region', 'sales', 'market_share', 'growth_rate',
+               'ev_type', 'vehicle_type', 'total_vehicle_sales']
+
+# Rows written to the database per batch when storing an uploaded CSV
+SAVE_CHUNK_ROWS = 200_000
 
 def load_sample_data():
     """
     Loads sample EV adoption data for demonstration purposes.
     Checks if data exists in database first. If not, loads sample data
-    and stores it in the database.
+    and stores it in the database. The database must already be
+    initialized (app.py does so once per process).
     
     Returns:
         pandas.DataFrame: Sample EV adoption data
     """
-    # Check if database has been initialized
-    try:
-        init_db()
-    except Exception as e:
-        print(f"Error initializing database: {e}")
-    
     # Check if data exists in database
     if db_has_data():
         print("Loading sample data from database")
@@ -37,23 +38,33 @@ def load_data_from_csv(file_path):
     Loads EV adoption data from a CSV file and stores it in the database.
     
     Args:
-        file_path (str): Path to the CSV file
+        file_path (str or file-like): Path to the CSV file or an in-memory buffer
         
     Returns:
         pandas.DataFrame: EV adoption data
     """
     try:
-        # Load the CSV file
-        data = pd.read_csv(file_path)
+        # Only parse the columns the dashboard uses, with the multithreaded pyarrow parser
+        header = pd.read_csv(file_path, nrows=0).columns
+        usecols = [col for col in header if col in CSV_COLUMNS]
+        if hasattr(file_path, 'seek'):
+            file_path.seek(0)  # Rewind buffers after reading the header
+        # Dtypes are left to the parser, so the database stores the exact values;
+        # clean_data does the in-memory downcasting
+        data = pd.read_csv(file_path, engine='pyarrow', usecols=usecols)
+        
+        # Keep text columns as Arrow strings rather than Python objects; numeric
+        # columns stay NumPy-backed so missing values remain NaN for the database save
+        text_columns = data.select_dtypes(include='object').columns
+        data[text_columns] = data[text_columns].astype('string[pyarrow]')
         
         # Initialize database if needed
         init_db()
         
-        # Clear existing data
-        clear_db_data()
-        
-        # Save to database
-        save_data_to_db(data)
+        # Replace existing data in batches, all in one transaction, so a failed
+        # batch leaves the previous data in place rather than a partial dataset
+        if not replace_db_data(data, SAVE_CHUNK_ROWS):
+            raise ValueError("the data could not be stored in the database")
         
         return data
     except Exception as e:
@@ -67,17 +78,3 @@ def get_data_metadata():
         tuple: (regions, years) - lists of unique regions and years
     """
     return get_db_metadata()
-
-def load_filtered_data(min_year=None, max_year=None, regions=None):
-    """
-    Loads filtered data from the database.
-    
-    Args:
-        min_year (int, optional): Minimum year to include
-        max_year (int, optional): Maximum year to include
-        regions (list, optional): List of regions to include
-        
-    Returns:
-        pandas.DataFrame: Filtered EV adoption data
-    """
-    return filter_data_from_db(min_year, max_year, regions)
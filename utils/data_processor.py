@@ -11,26 +11,59 @@ def clean_data(data):
     Returns:
         pandas.DataFrame: Cleaned EV adoption data
     """
-    # Make a copy to avoid modifying the original data
-    cleaned_data = data.copy()
+    # Shallow copy: every change below assigns whole new columns (and the final
+    # sort builds a new frame), so the original data is never modified and a
+    # deep copy of every column up front would be wasted
+    cleaned_data = data.copy(deep=False)
     
-    # Handle missing values
+    # Handle missing values; sales stay float64 so totals past 2**24 are exact,
+    # while market share (a percentage) is downcast to float32
     if 'sales' in cleaned_data.columns:
-        cleaned_data['sales'] = cleaned_data['sales'].fillna(0)
+        cleaned_data['sales'] = cleaned_data['sales'].fillna(0).astype(np.float64)
     
     if 'market_share' in cleaned_data.columns:
-        cleaned_data['market_share'] = cleaned_data['market_share'].fillna(0)
+        cleaned_data['market_share'] = cleaned_data['market_share'].fillna(0).astype(np.float32)
     
-    # Ensure year is an integer
+    # Ensure year is a compact integer
     if 'year' in cleaned_data.columns:
-        cleaned_data['year'] = pd.to_numeric(cleaned_data['year'], errors='coerce').fillna(0).astype(int)
+        cleaned_data['year'] = pd.to_numeric(cleaned_data['year'], errors='coerce').fillna(0).astype(np.int16)
     
-    # Ensure region names are standardized
+    # Ensure region names are standardized; categorical codes make
+    # filtering and grouping by region cheaper
     if 'region' in cleaned_data.columns:
-        cleaned_data['region'] = cleaned_data['region'].str.strip()
+        cleaned_data['region'] = cleaned_data['region'].str.strip().astype('category')
+    
+    # Type labels repeat across rows, so store them as categoricals too
+    for column in ('ev_type', 'vehicle_type'):
+        if column in cleaned_data.columns:
+            cleaned_data[column] = cleaned_data[column].astype('category')
+    
+    # Order rows by region, then year, so (region, year) groupings can skip re-sorting
+    if 'region' in cleaned_data.columns and 'year' in cleaned_data.columns:
+        cleaned_data = cleaned_data.sort_values(['region', 'year'], ignore_index=True)
     
     return cleaned_data
 
+def extract_metadata(data):
+    """
+    Extracts the regions and years available in the data, for the filter widgets.
+    
+    Args:
+        data (pandas.DataFrame): Cleaned EV adoption data
+        
+    Returns:
+        tuple: (regions, years) - sorted lists of unique regions and years
+    """
+    # clean_data makes region categorical, so its categories are already unique and sorted
+    region = data['region']
+    if isinstance(region.dtype, pd.CategoricalDtype):
+        regions = region.cat.remove_unused_categories().cat.categories.tolist()
+    else:
+        regions = sorted(region.dropna().unique().tolist())
+    
+    years = np.unique(data['year'].to_numpy()).tolist()
+    return regions, years
+
 def calculate_growth_rates(data):
     """
     Calculates year-over-year growth rates for EV sales by region.
@@ -45,36 +78,122 @@ def calculate_growth_rates(data):
         return pd.DataFrame()  # Return empty DataFrame if required columns are missing
     
     # Group by region and year, and calculate sales sum
-    yearly_sales = data.groupby(['region', 'year'])['sales'].sum().reset_index()
+    yearly_sales = data.groupby(['region', 'year'], observed=True)['sales'].sum().reset_index()
+    
+    return _growth_from_totals(yearly_sales)
+
+def _growth_from_totals(yearly_sales):
+    """Computes YoY growth from per (region, year) sales totals sorted by region, then year."""
+    # Rows are sorted by region then year, so each row's predecessor is the
+    # previous year of the same region unless the region code changes
+    region_codes, _ = pd.factorize(yearly_sales['region'])
+    same_region = np.zeros(len(yearly_sales), dtype=bool)
+    same_region[1:] = region_codes[1:] == region_codes[:-1]
+    
+    # Calculate year-over-year growth in one vectorized pass
+    sales = yearly_sales['sales'].to_numpy(dtype=np.float64)
+    prev_sales = np.roll(sales, 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Mark as NaN if previous sales were zero
+        growth = np.where(prev_sales > 0, (sales - prev_sales) / prev_sales * 100, np.nan)
+    
+    # The first year of each region has no growth rate
+    growth_rates = yearly_sales.loc[same_region, ['region', 'year']].reset_index(drop=True)
+    growth_rates['growth_rate'] = growth[same_region]
+    
+    return growth_rates
+
+def aggregate_by_year_region(data):
+    """
+    Pre-aggregates EV metrics by year and region so per-year views can be
+    sliced from the result instead of regrouping the full data.
+    
+    Args:
+        data (pandas.DataFrame): Cleaned EV adoption data
+        
+    Returns:
+        pandas.DataFrame: Summed sales (and mean market share, if available)
+            indexed by (year, region)
+    """
+    if 'year' not in data.columns or 'region' not in data.columns or 'sales' not in data.columns:
+        return pd.DataFrame()  # Return empty DataFrame if required columns are missing
     
-    # Calculate growth rates for each region
-    growth_rates = []
+    aggregations = {'sales': 'sum'}
+    if 'market_share' in data.columns:
+        aggregations['market_share'] = 'mean'
     
-    for region in yearly_sales['region'].unique():
-        region_data = yearly_sales[yearly_sales['region'] == region].sort_values('year')
+    return data.groupby(['year', 'region'], observed=True).agg(aggregations)
+
+def build_aggregates(data):
+    """
+    Builds the summaries the dashboard pages slice from, so they can be
+    computed once per dataset (e.g. in a background thread after loading).
+    
+    Args:
+        data (pandas.DataFrame): Cleaned EV adoption data
         
-        if len(region_data) <= 1:
-            continue  # Skip regions with only one year of data
+    Returns:
+        dict: Growth rates ('growth'), per (year, region) totals
+            ('by_year_region') and the same totals indexed by (region, year)
+            ('by_region_year'), total sales per year ('sales_by_year'), the
+            number of regions ('region_count'), the row positions of each year
+            ('year_positions') and region ('region_positions'), for select_rows,
+            the sorted region names ('regions'), the ten regions with the most
+            total sales ('top_regions'), the latest year ('latest_year') and its
+            rows ('latest')
+    """
+    # Index the rows once so pages look up a year or region instead of masking
+    # the full data; only positions are kept, not copies of the rows
+    year_positions = data.groupby('year', sort=False).indices if 'year' in data.columns else {}
+    region_positions = data.groupby('region', observed=True, sort=False).indices if 'region' in data.columns else {}
+    
+    # The index already holds every year, so the latest one needs no scan of the column
+    latest_year = max(year_positions) if year_positions else None
+    
+    # One grouping pass over the full data feeds both the per-year totals and
+    # the growth rates, which only need the (much smaller) totals table
+    by_year_region = aggregate_by_year_region(data)
+    if by_year_region.empty:
+        growth = pd.DataFrame()
+        by_region_year = by_year_region
+        sales_by_year = pd.Series(dtype=np.float64)
+        top_regions = []
+    else:
+        # Region-major copy of the (small) totals, so trend charts select regions with .loc
+        by_region_year = by_year_region.swaplevel().sort_index()
+        yearly_sales = by_region_year['sales'].reset_index()
+        growth = _growth_from_totals(yearly_sales)
+        sales_by_year = by_year_region['sales'].groupby(level='year').sum()
+        top_regions = by_year_region['sales'].groupby(level='region', observed=True).sum().nlargest(10).index.tolist()
+    
+    return {
+        'growth': growth,
+        'by_year_region': by_year_region,
+        'by_region_year': by_region_year,
+        'sales_by_year': sales_by_year,
+        'region_count': data['region'].nunique() if 'region' in data.columns else 0,
+        'latest_year': latest_year,
+        'year_positions': year_positions,
+        'region_positions': region_positions,
+        'regions': sorted(region_positions),
+        'top_regions': top_regions,
+        'latest': select_rows(data, year_positions, latest_year)
+    }
+
+def select_rows(data, positions, key):
+    """
+    Selects the rows of a year or region from a build_aggregates position index.
+    
+    Args:
+        data (pandas.DataFrame): The data the index was built from
+        positions (dict): 'year_positions' or 'region_positions' from build_aggregates
+        key: Year or region to select
         
-        # Calculate year-over-year growth
-        for i in range(1, len(region_data)):
-            prev_year = region_data.iloc[i-1]['year']
-            curr_year = region_data.iloc[i]['year']
-            prev_sales = region_data.iloc[i-1]['sales']
-            curr_sales = region_data.iloc[i]['sales']
-            
-            if prev_sales > 0:  # Avoid division by zero
-                growth_rate = ((curr_sales - prev_sales) / prev_sales) * 100
-            else:
-                growth_rate = np.nan  # Mark as NaN if previous sales were zero
-            
-            growth_rates.append({
-                'region': region,
-                'year': curr_year,
-                'growth_rate': growth_rate
-            })
-    
-    return pd.DataFrame(growth_rates)
+    Returns:
+        pandas.DataFrame: The matching rows (empty if the key is not present)
+    """
+    rows = positions.get(key)
+    return data.iloc[rows] if rows is not None else data.iloc[0:0]
 
 def calculate_market_share(data):
     """
@@ -109,15 +228,20 @@ def get_top_regions(data, year, metric='sales', n=5):
     Returns:
         pandas.DataFrame: Top regions data
     """
-    if year not in data['year'].unique() or metric not in data.columns:
-        return pd.DataFrame()  # Return empty DataFrame if year or metric is invalid
+    if metric not in data.columns:
+        return pd.DataFrame()  # Return empty DataFrame if metric is invalid
+    
+    # One comparison pass both selects the year and tells whether it exists
+    in_year = data['year'].to_numpy() == year
+    if not in_year.any():
+        return pd.DataFrame()  # Return empty DataFrame if year is invalid
     
-    year_data = data[data['year'] == year]
+    year_data = data[in_year]
     
     # Group by region and sum the metric
-    region_data = year_data.groupby('region')[metric].sum().reset_index()
+    region_data = year_data.groupby('region', observed=True)[metric].sum().reset_index()
     
     # Sort and get top n regions
-    top_regions = region_data.sort_values(metric, ascending=False).head(n)
+    top_regions = region_data.nlargest(n, metric)
     
     return top_regions
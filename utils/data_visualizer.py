@@ -1,11 +1,9 @@
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
+from utils.downsample import downsample_series
 
-def plot_global_trends(data, metric='sales', title=''):
+def plot_global_trends(data, metric='sales', title='', max_points=2000):
     """
     Creates a line chart showing global trends over time.
     
@@ -13,6 +11,7 @@ def plot_global_trends(data, metric='sales', title=''):
         data (pandas.DataFrame): Cleaned EV adoption data
         metric (str): The metric to visualize (e.g., 'sales', 'market_share')
         title (str): Title for the plot
+        max_points (int): Maximum number of points to draw (LTTB downsampled)
         
     Returns:
         plotly.graph_objects.Figure: Plotly figure object
@@ -29,18 +28,22 @@ def plot_global_trends(data, metric='sales', title=''):
     
     # Aggregate data by year
     yearly_data = data.groupby('year')[metric].sum().reset_index()
-    
-    # Create line chart
-    fig = px.line(
-        yearly_data, 
-        x='year', 
-        y=metric,
-        labels={metric: metric.capitalize(), 'year': 'Year'},
-        title=title or f'Global {metric.capitalize()} Trend'
-    )
+    yearly_data = downsample_series(yearly_data, 'year', metric, max_points)
+    
+    # Create a WebGL line chart directly from the arrays (no per-column copies
+    # through plotly.express); totals stay float64, since float32 would round
+    # sales totals past 2**24
+    fig = go.Figure(go.Scattergl(
+        x=yearly_data['year'].to_numpy(),
+        y=yearly_data[metric].to_numpy(dtype=np.float64),
+        mode='lines',
+        name=metric.capitalize()
+    ))
     
     fig.update_layout(
-        xaxis=dict(tickmode='linear'),
+        title=title or f'Global {metric.capitalize()} Trend',
+        xaxis=dict(tickmode='linear', title='Year'),
+        yaxis=dict(title=metric.capitalize()),
         hovermode='x unified'
     )
     
@@ -72,7 +75,7 @@ def plot_regional_comparison(data, year, metric='sales'):
     year_data = data[data['year'] == year]
     
     # Group by region and calculate the sum of the metric
-    region_data = year_data.groupby('region')[metric].sum().reset_index()
+    region_data = year_data.groupby('region', observed=True, sort=False)[metric].sum().reset_index()
     region_data = region_data.sort_values(metric, ascending=False)
     
     # Create bar chart
@@ -86,10 +89,9 @@ def plot_regional_comparison(data, year, metric='sales'):
         color_continuous_scale='Viridis'
     )
     
-    fig.update_layout(
-        xaxis={'categoryorder': 'total descending'},
-        hovermode='closest'
-    )
+    # Rows are already sorted by value, so the bars keep that order without a
+    # client-side category re-sort
+    fig.update_layout(hovermode='closest')
     
     return fig
 
@@ -116,7 +118,7 @@ def create_choropleth_map(data, metric='sales', title=''):
         return fig
     
     # Aggregate data by region
-    region_data = data.groupby('region')[metric].sum().reset_index()
+    region_data = data.groupby('region', observed=True, sort=False)[metric].sum().reset_index()
     
     # Create choropleth map
     fig = px.choropleth(
@@ -161,7 +163,8 @@ def plot_market_share_evolution(data):
         return fig
     
     # Calculate average market share by year and region
-    market_data = data.groupby(['year', 'region'])['market_share'].mean().reset_index()
+    market_data = data.groupby(['region', 'year'], observed=True)['market_share'].mean().reset_index()
+    market_data = downsample_series(market_data, 'year', 'market_share', 1200, group_col='region')
     
     # Create line chart
     fig = px.line(
@@ -201,8 +204,10 @@ def plot_growth_rates(growth_data):
         )
         return fig
     
-    # Filter growth rates to remove extreme outliers
-    valid_growth = growth_data[growth_data['growth_rate'].between(-100, 200)]
+    # Filter growth rates to remove extreme outliers, as one mask over the raw
+    # values (NaN compares false, so missing rates drop out too)
+    growth = growth_data['growth_rate'].to_numpy(dtype=np.float64)
+    valid_growth = growth_data[(growth >= -100) & (growth <= 200)]
     
     if valid_growth.empty:
         fig = go.Figure()
@@ -213,6 +218,9 @@ def plot_growth_rates(growth_data):
         )
         return fig
     
+    # Send growth rates as float32 to halve the serialized payload
+    valid_growth = valid_growth.astype({'growth_rate': np.float32})
+    
     # Create line chart
     fig = px.line(
         valid_growth,
@@ -220,7 +228,8 @@ def plot_growth_rates(growth_data):
         y='growth_rate',
         color='region',
         labels={'growth_rate': 'YoY Growth Rate (%)', 'year': 'Year', 'region': 'Region'},
-        title='Year-over-Year Growth in EV Adoption'
+        title='Year-over-Year Growth in EV Adoption',
+        render_mode='webgl'
     )
     
     fig.update_layout(
@@ -256,7 +265,7 @@ def create_stacked_area_chart(data, category_col, value_col, time_col='year', ti
         return fig
     
     # Group by time and category
-    grouped_data = data.groupby([time_col, category_col])[value_col].sum().reset_index()
+    grouped_data = data.groupby([time_col, category_col], observed=True)[value_col].sum().reset_index()
     
     # Create stacked area chart
     fig = px.area(
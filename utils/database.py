@@ -1,9 +1,9 @@
 import os
 import pandas as pd
-from sqlalchemy import create_engine, Column, Integer, Float, String, MetaData, Table, select, text
+import numpy as np
+from sqlalchemy import create_engine, event, Column, Integer, Float, String, Index
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.sql import func
 
 # Get database credentials from environment variables
 DATABASE_URL = os.environ.get('DATABASE_URL')
@@ -13,8 +13,21 @@ if not DATABASE_URL:
     print("Warning: DATABASE_URL environment variable not set. Using SQLite database instead.")
     DATABASE_URL = 'sqlite:///ev_data.db'
 
-# Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+# Create SQLAlchemy engine; pooled connections are reused across reruns and
+# sessions, and checked before use so a dropped server connection is replaced
+engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+
+if engine.dialect.name == 'sqlite':
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets dashboard sessions keep reading while an upload writes, and
+        # NORMAL sync is safe under WAL; the rest keeps temp data and pages in memory
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
 
 # Create base class for declarative models
 Base = declarative_base()
@@ -32,18 +45,38 @@ class EVData(Base):
     ev_type = Column(String, nullable=True)
     total_vehicle_sales = Column(Float, nullable=True)
     
+    # Serves the dashboard filters (region IN ... AND year BETWEEN ...) from one index
+    __table_args__ = (
+        Index('ix_ev_data_region_year', 'region', 'year'),
+    )
+    
     def __repr__(self):
         return f"<EVData(region='{self.region}', year={self.year}, sales={self.sales})>"
 
 # Initialize database
 def init_db():
     Base.metadata.create_all(engine)
+    # create_all skips indexes on tables that already exist, so add any missing ones explicitly
+    for index in EVData.__table__.indexes:
+        index.create(engine, checkfirst=True)
     print("Database tables created.")
 
 # Create a session factory
 Session = sessionmaker(bind=engine)
 
 # Function to save data to the database
+def _to_records(data_df):
+    """Converts a frame to one dict per row, aligned to the table's columns, with NaN mapped to NULL."""
+    # Align the frame to the table's columns once; optional columns that are
+    # missing come back as all-NaN
+    records = data_df.reindex(columns=['year', 'region', 'sales', 'market_share',
+                                       'growth_rate', 'ev_type', 'total_vehicle_sales'])
+    records = records.astype({'year': np.int64, 'sales': np.float64, 'market_share': np.float64,
+                              'growth_rate': np.float64, 'total_vehicle_sales': np.float64})
+    
+    # Plain Python values with NaN mapped to NULL
+    return records.astype(object).where(records.notna(), None).to_dict(orient='records')
+
 def save_data_to_db(data_df):
     """
     Save pandas DataFrame to database
@@ -54,22 +87,9 @@ def save_data_to_db(data_df):
     session = Session()
     
     try:
-        # Convert DataFrame rows to model instances
-        data_records = []
-        for _, row in data_df.iterrows():
-            record = EVData(
-                year=int(row['year']),
-                region=row['region'],
-                sales=float(row['sales']),
-                market_share=float(row['market_share']) if 'market_share' in row and pd.notna(row['market_share']) else None,
-                growth_rate=float(row['growth_rate']) if 'growth_rate' in row and pd.notna(row['growth_rate']) else None,
-                ev_type=row['ev_type'] if 'ev_type' in row and pd.notna(row['ev_type']) else None,
-                total_vehicle_sales=float(row['total_vehicle_sales']) if 'total_vehicle_sales' in row and pd.notna(row['total_vehicle_sales']) else None
-            )
-            data_records.append(record)
-        
-        # Add all records
-        session.add_all(data_records)
+        # Insert all rows as one executemany through Core, bypassing ORM object
+        # construction and the unit of work
+        session.execute(EVData.__table__.insert(), _to_records(data_df))
         session.commit()
         return True
     except Exception as e:
@@ -79,6 +99,35 @@ def save_data_to_db(data_df):
     finally:
         session.close()
 
+def replace_db_data(data_df, chunk_rows):
+    """
+    Replace all data in the database with a DataFrame, in a single transaction
+    
+    Args:
+        data_df (pandas.DataFrame): DataFrame containing EV data
+        chunk_rows (int): Rows inserted per batch, so only one batch of records
+            is held in memory at a time
+    
+    Returns:
+        bool: True if successful, False otherwise (the previous data is kept)
+    """
+    session = Session()
+    
+    try:
+        # The delete and every batch commit together, so readers never see a
+        # cleared or partially written table
+        session.query(EVData).delete()
+        for start in range(0, len(data_df), chunk_rows):
+            session.execute(EVData.__table__.insert(), _to_records(data_df.iloc[start:start + chunk_rows]))
+        session.commit()
+        return True
+    except Exception as e:
+        session.rollback()
+        print(f"Error replacing database data: {e}")
+        return False
+    finally:
+        session.close()
+
 # Function to load data from the database
 def load_data_from_db():
     """
@@ -90,34 +139,25 @@ def load_data_from_db():
     session = Session()
     
     try:
-        # Query all data
-        result = session.query(EVData).all()
-        
-        # Convert to DataFrame
-        data = []
-        for record in result:
-            row = {
-                'year': record.year,
-                'region': record.region,
-                'sales': record.sales
-            }
-            
-            # Add optional columns if they exist
-            if record.market_share is not None:
-                row['market_share'] = record.market_share
-            
-            if record.growth_rate is not None:
-                row['growth_rate'] = record.growth_rate
-                
-            if record.ev_type is not None:
-                row['ev_type'] = record.ev_type
-                
-            if record.total_vehicle_sales is not None:
-                row['total_vehicle_sales'] = record.total_vehicle_sales
-            
-            data.append(row)
+        # Select only the data columns, so rows come back as plain tuples and the
+        # frame is built column-wise instead of from per-row ORM objects and dicts
+        query = session.query(
+            EVData.year,
+            EVData.region,
+            EVData.sales,
+            EVData.market_share,
+            EVData.growth_rate,
+            EVData.ev_type,
+            EVData.total_vehicle_sales
+        )
+        data = pd.DataFrame(query.all(), columns=[column['name'] for column in query.column_descriptions])
         
-        return pd.DataFrame(data)
+        # Optional columns are only kept when at least one row has a value
+        empty_optional = [
+            column for column in ('market_share', 'growth_rate', 'ev_type', 'total_vehicle_sales')
+            if data[column].isna().all()
+        ]
+        return data.drop(columns=empty_optional)
     except Exception as e:
         print(f"Error loading data from database: {e}")
         return pd.DataFrame()
@@ -140,47 +180,38 @@ def filter_data_from_db(min_year=None, max_year=None, regions=None):
     session = Session()
     
     try:
-        # Start with base query
-        query = session.query(EVData)
+        # Select only the data columns so rows come back as plain tuples
+        # instead of hydrated ORM objects
+        query = session.query(
+            EVData.year,
+            EVData.region,
+            EVData.sales,
+            EVData.market_share,
+            EVData.growth_rate,
+            EVData.ev_type,
+            EVData.total_vehicle_sales
+        )
         
-        # Apply filters
-        if min_year is not None:
+        # Apply filters in the WHERE clause
+        if min_year is not None and max_year is not None:
+            query = query.filter(EVData.year.between(min_year, max_year))
+        elif min_year is not None:
             query = query.filter(EVData.year >= min_year)
-            
-        if max_year is not None:
+        elif max_year is not None:
             query = query.filter(EVData.year <= max_year)
             
         if regions is not None and len(regions) > 0:
             query = query.filter(EVData.region.in_(regions))
         
-        # Execute query
-        result = query.all()
-        
-        # Convert to DataFrame
-        data = []
-        for record in result:
-            row = {
-                'year': record.year,
-                'region': record.region,
-                'sales': record.sales
-            }
-            
-            # Add optional columns if they exist
-            if record.market_share is not None:
-                row['market_share'] = record.market_share
-            
-            if record.growth_rate is not None:
-                row['growth_rate'] = record.growth_rate
-                
-            if record.ev_type is not None:
-                row['ev_type'] = record.ev_type
-                
-            if record.total_vehicle_sales is not None:
-                row['total_vehicle_sales'] = record.total_vehicle_sales
-            
-            data.append(row)
+        # Build the frame column-wise from the result tuples
+        data = pd.DataFrame(query.all(), columns=[column['name'] for column in query.column_descriptions])
         
-        return pd.DataFrame(data)
+        # Optional columns are only kept when at least one row has a value
+        empty_optional = [
+            column for column in ('market_share', 'growth_rate', 'ev_type', 'total_vehicle_sales')
+            if data[column].isna().all()
+        ]
+        return data.drop(columns=empty_optional)
     except Exception as e:
         print(f"Error loading filtered data from database: {e}")
         return pd.DataFrame()
@@ -198,8 +229,8 @@ def db_has_data():
     session = Session()
     
     try:
-        count = session.query(func.count(EVData.id)).scalar()
-        return count > 0
+        # Only existence matters, so stop at the first row instead of counting them all
+        return session.query(EVData.id).limit(1).first() is not None
     except Exception as e:
         print(f"Error checking database data: {e}")
         return False
@@ -238,8 +269,11 @@ def get_db_metadata():
     session = Session()
     
     try:
-        regions = [r[0] for r in session.query(EVData.region).distinct()]
-        years = [y[0] for y in session.query(EVData.year).distinct().order_by(EVData.year)]
+        # One DISTINCT over (region, year) in a single round trip; the composite
+        # (region, year) index can answer it without reading the table
+        pairs = session.query(EVData.region, EVData.year).distinct().all()
+        regions = list(dict.fromkeys(region for region, _ in pairs))
+        years = sorted({year for _, year in pairs})
         return regions, years
     except Exception as e:
         print(f"Error retrieving database metadata: {e}")
@@ -0,0 +1,79 @@
+import pandas as pd
+import numpy as np
+
+def lttb(x, y, n_out):
+    """
+    Selects representative points of a line series using the
+    Largest-Triangle-Three-Buckets (LTTB) algorithm.
+
+    Args:
+        x (array-like): Sorted x values of the series
+        y (array-like): y values of the series
+        n_out (int): Number of points to keep
+
+    Returns:
+        numpy.ndarray: Positional indices of the points to keep
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+
+    if n_out >= n or n_out < 3:
+        return np.arange(n)  # Nothing to reduce
+
+    # Bucket boundaries for everything between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Average of the next bucket (the last point for the final bucket)
+        next_start = edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Keep the point forming the largest triangle with the previous pick
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+
+    return selected
+
+def downsample_series(data, x_col, y_col, n_out, group_col=None):
+    """
+    Downsamples line chart data with LTTB, optionally per group.
+
+    Args:
+        data (pandas.DataFrame): Line chart data sorted by x_col
+        x_col (str): Column name for the x axis
+        y_col (str): Column name for the y axis
+        n_out (int): Maximum number of points to keep per series
+        group_col (str, optional): Column identifying separate series
+
+    Returns:
+        pandas.DataFrame: Downsampled data
+    """
+    if group_col is None:
+        if len(data) <= n_out:
+            return data
+        return data.iloc[lttb(data[x_col].values, data[y_col].values, n_out)]
+
+    # Groups that already fit are passed through untouched
+    sizes = data.groupby(group_col, observed=True).size()
+    if sizes.empty or sizes.max() <= n_out:
+        return data
+
+    parts = [
+        group.iloc[lttb(group[x_col].values, group[y_col].values, n_out)]
+        for _, group in data.groupby(group_col, observed=True, sort=False)
+    ]
+    return pd.concat(parts, ignore_index=True)
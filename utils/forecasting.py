@@ -1,11 +1,119 @@
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.pipeline import make_pipeline
-from sklearn.metrics import mean_squared_error, r2_score
+import plotly.graph_objects as go
 
-def forecast_linear(data, time_col='year', target_col='sales', periods=5):
+class _LinearModel:
+    """A fitted straight line, exposing the scikit-learn style attributes callers use."""
+    
+    __slots__ = ('coef_', 'intercept_')
+    
+    def __init__(self, slope, intercept):
+        self.coef_ = np.array([slope])
+        self.intercept_ = intercept
+    
+    def predict(self, X):
+        return self.coef_[0] * np.ravel(X) + self.intercept_
+
+class _PolynomialModel:
+    """A fitted polynomial in time offset from origin, with a scikit-learn style predict()."""
+    
+    __slots__ = ('coefs', 'origin')
+    
+    def __init__(self, coefs, origin):
+        self.coefs = coefs  # Lowest degree first
+        self.origin = origin
+    
+    def predict(self, X):
+        return np.polynomial.polynomial.polyval(np.ravel(X) - self.origin, self.coefs)
+
+def _fit_metrics(y, y_pred):
+    """Returns (mse, r2) of predictions on the training data, with r2 following
+    scikit-learn's conventions (NaN for a single sample; for a constant target,
+    1.0 if fitted exactly, else 0.0)."""
+    residuals = y - y_pred
+    ss_res = np.dot(residuals, residuals)
+    deviations = y - y.mean()
+    ss_tot = np.dot(deviations, deviations)
+    if len(y) < 2:
+        r2 = np.nan
+    elif ss_tot > 0:
+        r2 = 1 - ss_res / ss_tot
+    else:
+        r2 = 1.0 if ss_res == 0 else 0.0
+    return ss_res / len(y), r2
+
+def _future_periods(last_period, periods):
+    """Returns the periods following last_period, as int64."""
+    return np.arange(last_period + 1, last_period + periods + 1, dtype=np.int64)
+
+def _forecast_linear_core(x, y, periods):
+    """
+    Fits a line to pre-aggregated, sorted periods and extends it into the future.
+    
+    Args:
+        x (numpy.ndarray): Time periods, sorted ascending
+        y (numpy.ndarray): Aggregated target values for those periods, as float64
+        periods (int): Number of periods to forecast into the future
+        
+    Returns:
+        tuple: (model, future_periods, future_predictions)
+    """
+    # Closed form, in float64: slope = cov(x, y) / var(x)
+    x_mean, y_mean = x.mean(dtype=np.float64), y.mean()
+    dx = x - x_mean
+    dx_sq = np.dot(dx, dx)
+    slope = np.dot(dx, y - y_mean) / dx_sq if dx_sq > 0 else 0.0
+    model = _LinearModel(slope, y_mean - slope * x_mean)
+    
+    future_periods = _future_periods(x[-1], periods)
+    return model, future_periods, model.predict(future_periods)
+
+def _forecast_polynomial_core(x, y, periods, degree):
+    """
+    Fits a polynomial to pre-aggregated, sorted periods and extends it into the future.
+    
+    Args:
+        x (numpy.ndarray): Time periods, sorted ascending
+        y (numpy.ndarray): Aggregated target values for those periods, as float64
+        periods (int): Number of periods to forecast into the future
+        degree (int): Degree of the polynomial function
+        
+    Returns:
+        tuple: (model, future_periods, future_predictions)
+    """
+    # Least-squares fit with time offset from the first period, so the
+    # Vandermonde matrix stays well conditioned
+    origin = x[0]
+    coefs = np.polynomial.polynomial.polyfit(x - origin, y, degree)
+    model = _PolynomialModel(coefs, origin)
+    
+    future_periods = _future_periods(x[-1], periods)
+    return model, future_periods, model.predict(future_periods)
+
+# Row labels of forecast frames, stored as a categorical
+FORECAST_TYPES = ['historical', 'forecast']
+
+def _forecast_frame(time_series, future_periods, future_predictions, time_col, target_col):
+    """Lays out historical (period, value) rows followed by the forecast rows."""
+    # Fill preallocated columns instead of concatenating two intermediate frames
+    n_hist = len(time_series)
+    n = n_hist + len(future_periods)
+    times = np.empty(n, dtype=np.int64)
+    times[:n_hist] = time_series[time_col].to_numpy()
+    times[n_hist:] = future_periods
+    values = np.empty(n, dtype=np.float64)
+    values[:n_hist] = time_series[target_col].to_numpy()
+    values[n_hist:] = future_predictions
+    type_codes = np.zeros(n, dtype=np.int8)
+    type_codes[n_hist:] = 1
+    
+    return pd.DataFrame({
+        time_col: times,
+        target_col: values,
+        'type': pd.Categorical.from_codes(type_codes, FORECAST_TYPES)
+    }, copy=False)
+
+def forecast_linear(data, time_col='year', target_col='sales', periods=5, compute_metrics=True):
     """
     Performs simple linear regression forecasting for time series data.
     
@@ -14,54 +122,36 @@ def forecast_linear(data, time_col='year', target_col='sales', periods=5):
         time_col (str): Column name for time periods
         target_col (str): Column name for the target variable to forecast
         periods (int): Number of periods to forecast into the future
+        compute_metrics (bool): Whether to score the fit on the training data;
+            callers that only need the forecast can skip it
         
     Returns:
         tuple: (forecast_df, model_metrics, model)
             - forecast_df: DataFrame with historical and forecasted values
             - model_metrics: Dictionary with model performance metrics
+              (empty when compute_metrics is False)
             - model: The fitted model object
     """
     if time_col not in data.columns or target_col not in data.columns or len(data) < 3:
         return pd.DataFrame(), {'error': 'Insufficient data for forecasting'}, None
     
-    # Aggregate data by time period
-    time_series = data.groupby(time_col)[target_col].sum().reset_index()
-    time_series = time_series.sort_values(time_col)
-    
-    # Prepare data for modeling
-    X = time_series[time_col].values.reshape(-1, 1)
-    y = time_series[target_col].values
-    
-    # Train linear regression model
-    model = LinearRegression()
-    model.fit(X, y)
-    
-    # Calculate metrics on training data
-    y_pred = model.predict(X)
-    mse = mean_squared_error(y, y_pred)
-    r2 = r2_score(y, y_pred)
-    
-    # Generate forecast periods
-    last_period = time_series[time_col].max()
-    future_periods = np.array(range(last_period + 1, last_period + periods + 1)).reshape(-1, 1)
+    # Aggregate data by time period; groupby already returns the periods sorted
+    time_series = data.groupby(time_col, sort=True, observed=True, as_index=False)[target_col].sum()
+    if len(time_series) < 3:
+        # Many rows can still cover too few periods to fit a trend
+        return pd.DataFrame(), {'error': 'Insufficient data for forecasting'}, None
+    x = time_series[time_col].to_numpy()
+    y = time_series[target_col].to_numpy(dtype=np.float64)
     
-    # Make predictions
-    future_predictions = model.predict(future_periods)
+    model, future_periods, future_predictions = _forecast_linear_core(x, y, periods)
     
     # Create forecast DataFrame
-    historical = pd.DataFrame({
-        time_col: time_series[time_col],
-        target_col: time_series[target_col],
-        'type': 'historical'
-    })
+    forecast_df = _forecast_frame(time_series, future_periods, future_predictions, time_col, target_col)
+    if not compute_metrics:
+        return forecast_df, {}, model
     
-    future = pd.DataFrame({
-        time_col: future_periods.flatten(),
-        target_col: future_predictions,
-        'type': 'forecast'
-    })
-    
-    forecast_df = pd.concat([historical, future], ignore_index=True)
+    # Calculate metrics on training data
+    mse, r2 = _fit_metrics(y, model.predict(x))
     
     # Model metrics
     model_metrics = {
@@ -74,7 +164,7 @@ def forecast_linear(data, time_col='year', target_col='sales', periods=5):
     
     return forecast_df, model_metrics, model
 
-def forecast_polynomial(data, time_col='year', target_col='sales', periods=5, degree=2):
+def forecast_polynomial(data, time_col='year', target_col='sales', periods=5, degree=2, compute_metrics=True):
     """
     Performs polynomial regression forecasting for time series data.
     
@@ -84,54 +174,36 @@ def forecast_polynomial(data, time_col='year', target_col='sales', periods=5, de
         target_col (str): Column name for the target variable to forecast
         periods (int): Number of periods to forecast into the future
         degree (int): Degree of the polynomial function
+        compute_metrics (bool): Whether to score the fit on the training data;
+            callers that only need the forecast can skip it
         
     Returns:
         tuple: (forecast_df, model_metrics, model)
             - forecast_df: DataFrame with historical and forecasted values
             - model_metrics: Dictionary with model performance metrics
+              (empty when compute_metrics is False)
             - model: The fitted model object
     """
     if time_col not in data.columns or target_col not in data.columns or len(data) < degree + 1:
         return pd.DataFrame(), {'error': 'Insufficient data for polynomial forecasting'}, None
     
-    # Aggregate data by time period
-    time_series = data.groupby(time_col)[target_col].sum().reset_index()
-    time_series = time_series.sort_values(time_col)
-    
-    # Prepare data for modeling
-    X = time_series[time_col].values.reshape(-1, 1)
-    y = time_series[target_col].values
-    
-    # Create polynomial features and model
-    model = make_pipeline(PolynomialFeatures(degree), LinearRegression())
-    model.fit(X, y)
-    
-    # Calculate metrics on training data
-    y_pred = model.predict(X)
-    mse = mean_squared_error(y, y_pred)
-    r2 = r2_score(y, y_pred)
-    
-    # Generate forecast periods
-    last_period = time_series[time_col].max()
-    future_periods = np.array(range(last_period + 1, last_period + periods + 1)).reshape(-1, 1)
+    # Aggregate data by time period; groupby already returns the periods sorted
+    time_series = data.groupby(time_col, sort=True, observed=True, as_index=False)[target_col].sum()
+    if len(time_series) < degree + 1:
+        # Many rows can still cover too few periods to fit the polynomial
+        return pd.DataFrame(), {'error': 'Insufficient data for polynomial forecasting'}, None
+    x = time_series[time_col].to_numpy()
+    y = time_series[target_col].to_numpy(dtype=np.float64)
     
-    # Make predictions
-    future_predictions = model.predict(future_periods)
+    model, future_periods, future_predictions = _forecast_polynomial_core(x, y, periods, degree)
     
     # Create forecast DataFrame
-    historical = pd.DataFrame({
-        time_col: time_series[time_col],
-        target_col: time_series[target_col],
-        'type': 'historical'
-    })
+    forecast_df = _forecast_frame(time_series, future_periods, future_predictions, time_col, target_col)
+    if not compute_metrics:
+        return forecast_df, {}, model
     
-    future = pd.DataFrame({
-        time_col: future_periods.flatten(),
-        target_col: future_predictions,
-        'type': 'forecast'
-    })
-    
-    forecast_df = pd.concat([historical, future], ignore_index=True)
+    # Calculate metrics on training data
+    mse, r2 = _fit_metrics(y, model.predict(x))
     
     # Model metrics
     model_metrics = {
@@ -143,17 +215,19 @@ def forecast_polynomial(data, time_col='year', target_col='sales', periods=5, de
     
     return forecast_df, model_metrics, model
 
-def forecast_by_region(data, region_col='region', time_col='year', target_col='sales', periods=5, method='linear'):
+def forecast_by_region(data, region_col='region', time_col='year', target_col='sales', periods=5, method='linear', degree=2):
     """
     Performs forecasting for multiple regions.
     
     Args:
         data (pandas.DataFrame): Time series data to forecast
-        region_col (str): Column name for regions
+        region_col (str): Column name for regions; a categorical column (as
+            produced by clean_data) groups on its codes without hashing strings
         time_col (str): Column name for time periods
         target_col (str): Column name for the target variable to forecast
         periods (int): Number of periods to forecast into the future
         method (str): Forecasting method ('linear' or 'polynomial')
+        degree (int): Degree of the polynomial function, for the 'polynomial' method
         
     Returns:
         pandas.DataFrame: Forecasted values for all regions
@@ -161,29 +235,95 @@ def forecast_by_region(data, region_col='region', time_col='year', target_col='s
     if region_col not in data.columns or time_col not in data.columns or target_col not in data.columns:
         return pd.DataFrame()
     
-    regions = data[region_col].unique()
+    # A polynomial fit needs at least degree + 1 periods
+    min_points = max(3, degree + 1) if method == 'polynomial' else 3
     all_forecasts = []
     
-    for region in regions:
-        region_data = data[data[region_col] == region]
-        
-        if len(region_data) < 3:
-            continue  # Skip regions with insufficient data
+    # One two-key aggregation yields the (period, region) totals, and from them
+    # each region's number of observed periods, without scanning the data per region
+    totals = data.groupby([time_col, region_col], sort=True, observed=True)[target_col].sum().unstack(region_col)
+    period_counts = totals.count()
+    
+    # Regions observed in every year share one design matrix, so they are fitted together
+    on_grid = (period_counts == len(totals)).to_numpy()
+    if len(totals) >= min_points and on_grid.any():
+        all_forecasts.append(_forecast_on_year_grid(
+            totals.loc[:, on_grid], region_col, time_col, target_col, periods,
+            degree if method == 'polynomial' else 1
+        ))
+        fitted = set(totals.columns[on_grid])
+    else:
+        fitted = set()
+    
+    # Remaining regions have gaps in their years and are fitted one by one,
+    # from their column of the totals above rather than by regrouping the data
+    fit_core = _forecast_polynomial_core if method == 'polynomial' else _forecast_linear_core
+    fit_args = (degree,) if method == 'polynomial' else ()
+    for region, period_count in period_counts.items():
+        if region in fitted or period_count < min_points:
+            continue  # Skip regions with too few periods to fit
         
-        if method == 'polynomial':
-            forecast_df, _, _ = forecast_polynomial(region_data, time_col, target_col, periods)
-        else:
-            forecast_df, _, _ = forecast_linear(region_data, time_col, target_col, periods)
+        time_series = totals[region].dropna().rename_axis(time_col).rename(target_col).reset_index()
+        x = time_series[time_col].to_numpy()
+        _, future_periods, future_predictions = fit_core(x, time_series[target_col].to_numpy(dtype=np.float64), periods, *fit_args)
         
-        if not forecast_df.empty:
-            forecast_df[region_col] = region
-            all_forecasts.append(forecast_df)
-    
-    if all_forecasts:
+        forecast_df = _forecast_frame(time_series, future_periods, future_predictions, time_col, target_col)
+        forecast_df[region_col] = region
+        all_forecasts.append(forecast_df)
+    
+    if len(all_forecasts) == 1:
+        # Typically every region is on the year grid and its frame, built from
+        # preallocated arrays, already is the result; concatenating would copy it
+        return all_forecasts[0]
+    elif all_forecasts:
         return pd.concat(all_forecasts, ignore_index=True)
     else:
         return pd.DataFrame()
 
+def _forecast_on_year_grid(totals, region_col, time_col, target_col, periods, degree):
+    """
+    Fits a polynomial per region with one least-squares solve for all regions.
+    
+    Args:
+        totals (pandas.DataFrame): Target totals with one row per period (sorted)
+            and one column per region, without missing values
+        region_col (str): Column name for regions in the output
+        time_col (str): Column name for time periods
+        target_col (str): Column name for the target variable
+        periods (int): Number of periods to forecast into the future
+        degree (int): Degree of the polynomial function (1 for linear)
+        
+    Returns:
+        pandas.DataFrame: Historical and forecasted values for every region,
+            laid out like the per-region forecast_linear/forecast_polynomial output
+    """
+    times = totals.index.to_numpy(dtype=np.int64)
+    values = totals.to_numpy(dtype=np.float64)
+    future_times = _future_periods(times[-1], periods)
+    
+    offsets = times - times[0]
+    if degree == 1:
+        # Lines have a closed form; one matrix-vector product gives every region's slope
+        dx = offsets - offsets.mean()
+        means = values.mean(axis=0)
+        slopes = (dx @ values) / (dx @ dx)
+        coefs = np.vstack([means - slopes * offsets.mean(), slopes])
+    else:
+        # Offsetting time from the first period keeps the Vandermonde matrix well conditioned
+        coefs = np.polynomial.polynomial.polyfit(offsets, values, degree)
+    future_values = np.polynomial.polynomial.polyval(future_times - times[0], coefs)
+    
+    # Each region gets its historical rows followed by its forecast rows
+    n_regions = values.shape[1]
+    block_times = np.concatenate([times, future_times])
+    block_types = np.repeat(np.array([0, 1], dtype=np.int8), [len(times), periods])
+    return pd.DataFrame({
+        time_col: np.tile(block_times, n_regions),
+        target_col: np.concatenate([values.T, future_values], axis=1).ravel(),
+        'type': pd.Categorical.from_codes(np.tile(block_types, n_regions), FORECAST_TYPES),
+        region_col: np.repeat(totals.columns.to_numpy(), len(block_times))
+    }, copy=False)
+
 def plot_forecast(forecast_df, time_col='year', target_col='sales', title=''):
     """
     Creates a visualization of forecasted values.
@@ -198,7 +338,6 @@ def plot_forecast(forecast_df, time_col='year', target_col='sales', title=''):
         plotly.graph_objects.Figure: Plotly figure object
     """
     if forecast_df.empty or 'type' not in forecast_df.columns:
-        import plotly.graph_objects as go
         fig = go.Figure()
         fig.add_annotation(
             text="Insufficient data for forecast visualization",
@@ -207,24 +346,22 @@ def plot_forecast(forecast_df, time_col='year', target_col='sales', title=''):
         )
         return fig
     
-    import plotly.express as px
+    # The two series are known up front, so split them with one mask and add
+    # their traces directly instead of letting px.line group by 'type'; on the
+    # categorical 'type' column the comparison runs on its int8 codes
+    times = forecast_df[time_col].to_numpy()
+    values = forecast_df[target_col].to_numpy()
+    is_forecast = (forecast_df['type'] == 'forecast').to_numpy()
     
-    # Create separate traces for historical and forecast data
-    historical = forecast_df[forecast_df['type'] == 'historical']
-    forecast = forecast_df[forecast_df['type'] == 'forecast']
-    
-    fig = px.line(
-        forecast_df, 
-        x=time_col, 
-        y=target_col,
-        color='type',
-        labels={target_col: target_col.capitalize(), time_col: time_col.capitalize()},
-        title=title or f'Forecast of {target_col.capitalize()} Over Time',
-        color_discrete_map={'historical': 'blue', 'forecast': 'red'}
-    )
+    fig = go.Figure()
+    for name, mask, color in (('historical', ~is_forecast, 'blue'), ('forecast', is_forecast, 'red')):
+        fig.add_trace(go.Scatter(x=times[mask], y=values[mask], mode='lines', name=name, line=dict(color=color)))
     
     fig.update_layout(
-        xaxis=dict(tickmode='linear'),
+        title=title or f'Forecast of {target_col.capitalize()} Over Time',
+        xaxis=dict(tickmode='linear', title=time_col.capitalize()),
+        yaxis=dict(title=target_col.capitalize()),
+        legend=dict(title='type'),
         hovermode='x unified'
     )
     
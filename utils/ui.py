@@ -0,0 +1,33 @@
+import streamlit as st
+
+def format_data_summary(n_records, n_regions, year_min, year_max):
+    """
+    Formats the post-load summary values once so they can be kept in
+    session state instead of being re-formatted on every rerun.
+    
+    Args:
+        n_records (int): Number of records loaded
+        n_regions (int): Number of distinct regions
+        year_min (int): First year in the data
+        year_max (int): Last year in the data
+        
+    Returns:
+        dict: Display strings keyed by 'records', 'regions' and 'period'
+    """
+    return {
+        'records': f"{n_records:,}",
+        'regions': f"{n_regions}",
+        'period': f"{year_min} - {year_max}"
+    }
+
+def render_data_summary(summary):
+    """
+    Displays the three-column summary shown after a dataset is loaded.
+    
+    Args:
+        summary (dict): Display strings from format_data_summary
+    """
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total Records", summary['records'])
+    col2.metric("Regions", summary['regions'])
+    col3.metric("Time Period", summary['period'])